@@ -1,11 +1,33 @@
 import streamlit as st
+import bisect
+import cProfile
 import datetime
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import hashlib
 import os
+import heapq
 import html
+import queue
+import re
+import sqlite3
+import sys
+import threading
+import time
+import unicodedata
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import replace
+from functools import partial, wraps
+from streamlit.errors import StreamlitAPIException
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 from supabase import create_client, Client
 
+from zoneinfo import ZoneInfo
+
+from models import Post, Reply, format_date, format_time, format_time_ago, set_display_timezone
+
 # 페이지 설정 (가장 먼저 실행되어야 함)
 st.set_page_config(
     page_title="2025 AI(새)로고침! 우리 교실 앱 공모전",
@@ -14,54 +36,1818 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+# 전체 실행 소요 시간 측정 시작 (관리자 통계 탭의 성능 항목)
+run_started = time.perf_counter()
+
 # Supabase 설정
 SUPABASE_URL = st.secrets.get("SUPABASE_URL", "")
 SUPABASE_KEY = st.secrets.get("SUPABASE_ANON_KEY", "")
 
-# Supabase 클라이언트 초기화
+# 저장소 설정 ("supabase" 또는 "sqlite", 미지정 시 Supabase 설정 여부로 결정)
+STORAGE_BACKEND = st.secrets.get("STORAGE_BACKEND", "supabase" if SUPABASE_URL and SUPABASE_KEY else "sqlite")
+SQLITE_PATH = st.secrets.get("SQLITE_PATH", "community.db")
+
+# 게시물/답글 시각을 표시할 시간대 (저장은 항상 UTC, 기본값은 저장된 UTC 시각을 그대로 표시)
+DISPLAY_TIMEZONE = st.secrets.get("DISPLAY_TIMEZONE", "UTC")
+set_display_timezone(ZoneInfo(DISPLAY_TIMEZONE))
+
+# 실행 프로파일러 설정 (관리자 전용)
+# PROFILE_ENABLED를 켜면 관리자의 모든 전체 실행을, 아니면 ?profile=pstats 또는 ?profile=collapsed가
+# 붙은 실행만 프로파일링해 PROFILE_DIR에 저장 (꺼져 있으면 실행마다 설정 확인 외의 작업 없음)
+PROFILE_ENABLED = bool(st.secrets.get("PROFILE_ENABLED", False))
+PROFILE_FORMAT = st.secrets.get("PROFILE_FORMAT", "pstats")
+PROFILE_DIR = st.secrets.get("PROFILE_DIR", "profiles")
+PROFILE_FORMATS = ("pstats", "collapsed")
+PROFILE_SAMPLE_INTERVAL = 0.005  # collapsed 형식의 표본 추출 간격 (초)
+PROFILE_MAX_SECONDS = 120  # 표본 추출 최대 시간 (초, 끝나지 않은 실행 대비)
+
+# 스크립트 실행 프로파일러
+class RunProfiler:
+    """스크립트 실행 한 번을 프로파일링해 '시각_메뉴' 이름의 파일로 저장합니다.
+    
+    pstats 형식은 cProfile로 모든 함수 호출을 기록하고 (snakeviz, gprof2dot 등으로 확인),
+    collapsed 형식은 스크립트 스레드의 호출 스택을 일정 간격으로 표본 추출해
+    flamegraph.pl/speedscope가 바로 읽는 '호출;스택 횟수' 줄로 저장합니다.
+    저장소 요청은 공유 스레드 풀에서 실행되므로 스크립트 스레드가 결과를 기다린 시간으로 나타납니다.
+    """
+
+    def __init__(self, fmt, label):
+        self.fmt = fmt
+        self.label = label
+        self.started_at = datetime.now()
+        self._profile = None
+        self._stacks = Counter()  # 'root;...;leaf' -> 표본 수
+        self._stopped = threading.Event()
+        self._sampler = None
+
+    def start(self):
+        if self.fmt == "pstats":
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            self._sampler = threading.Thread(
+                target=self._sample, args=(threading.get_ident(),), name="run-profiler", daemon=True
+            )
+            self._sampler.start()
+
+    def _sample(self, thread_id):
+        deadline = time.monotonic() + PROFILE_MAX_SECONDS
+        while not self._stopped.wait(PROFILE_SAMPLE_INTERVAL) and time.monotonic() < deadline:
+            frame = sys._current_frames().get(thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self._stacks[";".join(reversed(stack))] += 1
+
+    def stop(self, directory=PROFILE_DIR):
+        """프로파일링을 끝내고 결과를 저장한 뒤 파일 경로를 반환합니다."""
+        page = re.sub(r"\W+", "_", self.label).strip("_") or "app"
+        name = f"{self.started_at:%Y%m%d-%H%M%S-%f}_{page}"
+        os.makedirs(directory, exist_ok=True)
+        if self._profile is not None:
+            self._profile.disable()
+            path = os.path.join(directory, f"{name}.pstats")
+            self._profile.dump_stats(path)
+        else:
+            self._stopped.set()
+            self._sampler.join()
+            path = os.path.join(directory, f"{name}.collapsed")
+            with open(path, "w", encoding="utf-8") as f:
+                for stack, count in sorted(self._stacks.items()):
+                    f.write(f"{stack} {count}\n")
+        return path
+
+# 이번 실행의 프로파일 형식 확인 함수
+def requested_profile_format():
+    """관리자가 프로파일링을 요청한 실행이면 형식을, 아니면 None을 반환합니다."""
+    if not st.session_state.get("is_admin", False):
+        return None
+    fmt = st.query_params.get("profile")
+    if fmt is None:
+        return PROFILE_FORMAT if PROFILE_ENABLED else None
+    if fmt in ("1", "true"):
+        fmt = PROFILE_FORMAT
+    return fmt if fmt in PROFILE_FORMATS else None
+
+# 프로파일 저장 함수
+def finish_run_profile(profiler):
+    try:
+        path = profiler.stop()
+        st.toast(f"⏱️ 실행 프로파일을 저장했습니다: {path}")
+    except Exception as e:
+        st.error(f"프로파일 저장 중 오류가 발생했습니다: {e}")
+
+# 이전 실행이 st.rerun()으로 중단되어 저장하지 못한 프로파일 저장
+if "run_profiler" in st.session_state:
+    finish_run_profile(st.session_state.pop("run_profiler"))
+
+run_profile_format = requested_profile_format()
+if run_profile_format:
+    run_profiler = RunProfiler(run_profile_format, st.session_state.get("sidebar_menu", ""))
+    st.session_state.run_profiler = run_profiler
+    run_profiler.start()
+
+# 게시물 구분
+POST_CATEGORIES = ["질문", "정보공유", "아이디어", "기타"]
+
+# 게시물 조회 시 사용하는 컬럼
+POST_COLUMNS = 'id, name, category, text, created_at'
+
+# in_ 필터 한 요청에 담을 ID 수 (요청 URL 길이 제한 대비)
+ID_BATCH_SIZE = 200
+
+# Supabase(PostgREST)가 한 응답에 담는 최대 행 수 (max-rows 기본값, 더 많으면 정렬 키 기준으로 이어서 조회)
+SUPABASE_MAX_ROWS = 1000
+
+# 저장소 동시 요청 스레드 수 (프로세스 전체 공유) 및 요청별 제한 시간 (초)
+IO_MAX_WORKERS = 8
+IO_TIMEOUT = 10
+IO_THREAD_PREFIX = "storage-io"
+
 @st.cache_resource
-def init_supabase():
-    if SUPABASE_URL and SUPABASE_KEY:
-        return create_client(SUPABASE_URL, SUPABASE_KEY)
-    return None
-
-supabase = init_supabase()
-
-# Supabase 데이터 로드 함수
-@st.cache_data(ttl=5)  # 5초 캐시 (실시간성 향상)
-def load_posts_from_supabase():
-    """Supabase에서 게시물 데이터를 로드합니다."""
-    if not supabase:
-        return []
+def get_io_executor():
+    return ThreadPoolExecutor(max_workers=IO_MAX_WORKERS, thread_name_prefix=IO_THREAD_PREFIX)
+
+# 서로 독립적인 저장소 요청을 동시에 실행하는 함수
+def run_concurrently(*calls, timeout=IO_TIMEOUT):
+    """인자 없는 함수들을 공유 스레드 풀에서 동시에 실행하고 결과를 순서대로 반환합니다.
     
+    각 요청은 제출 시점부터 timeout초 안에 끝나야 하며, 초과하거나 실패하면 예외가 그대로 전달됩니다.
+    (요청이 하나여도 제한 시간을 지키도록 풀에서 실행)
+    풀의 작업 스레드 안에서 호출되면 (풀 고갈로 인한 교착을 막기 위해) 순서대로 실행합니다.
+    """
+    if threading.current_thread().name.startswith(IO_THREAD_PREFIX):
+        return [call() for call in calls]
+    
+    executor = get_io_executor()
+    started = time.monotonic()
+    futures = [executor.submit(call) for call in calls]
     try:
-        response = supabase.table('post').select('id, name, category, text, created_at').order('created_at', desc=True).execute()
+        return [future.result(timeout=max(started + timeout - time.monotonic(), 0)) for future in futures]
+    finally:
+        # 실패 시 아직 시작하지 않은 요청은 취소
+        for future in futures:
+            future.cancel()
+
+# 저장소 인터페이스
+class Storage(ABC):
+    """게시물/답글 저장소 인터페이스입니다.
+    
+    모든 메서드는 Supabase 응답과 같은 형태의 행(dict)을 반환하며,
+    게시물 행은 id, name, category, text, created_at,
+    답글 행은 reply_id, id(게시물 ID), reply, created_at 키를 가집니다.
+    """
+
+    @abstractmethod
+    def fetch_posts(self, since=None):
+        """게시물을 조회합니다. since가 있으면 created_at이 since 이상인 행만 반환합니다."""
+
+    @abstractmethod
+    def fetch_post_page(self, cursor, limit):
+        """(created_at, id) 커서 이전의 게시물을 최신순으로 최대 limit개 조회합니다."""
+
+    @abstractmethod
+    def fetch_posts_by_ids(self, post_ids):
+        """지정한 ID의 게시물을 조회합니다."""
+
+    @abstractmethod
+    def fetch_post_ids(self):
+        """모든 게시물 ID를 set으로 반환합니다."""
+
+    @abstractmethod
+    def count_posts(self, category=None):
+        """게시물 수를 반환합니다. category가 있으면 해당 구분의 게시물만 셉니다."""
+
+    @abstractmethod
+    def count_answered_questions(self):
+        """답글이 하나 이상 달린 질문 수를 반환합니다."""
+
+    @abstractmethod
+    def fetch_replies(self, post_ids=None, since=None):
+        """답글을 작성순으로 조회합니다. post_ids, since(초과)로 범위를 좁힐 수 있습니다."""
+
+    @abstractmethod
+    def count_replies(self):
+        """답글 수를 반환합니다."""
+
+    @abstractmethod
+    def insert_posts(self, rows):
+        """게시물 여러 개를 한 번에 저장하고 저장된 행을 같은 순서로 반환합니다."""
+
+    @abstractmethod
+    def delete_posts(self, post_ids):
+        """지정한 ID의 게시물을 한 번의 요청으로 삭제합니다."""
+
+    @abstractmethod
+    def insert_replies(self, rows):
+        """답글 여러 개를 한 번에 저장하고 저장된 행을 같은 순서로 반환합니다."""
+
+    @abstractmethod
+    def fetch_notices(self):
+        """공지사항(id, type, content, created_at)을 작성순으로 조회합니다."""
+
+    @abstractmethod
+    def insert_notice(self, data):
+        """공지사항 하나를 저장합니다."""
+
+    @abstractmethod
+    def delete_notice(self, notice_id):
+        """지정한 ID의 공지사항을 삭제합니다."""
+
+    @abstractmethod
+    def fetch_blocked_users(self):
+        """차단된 사용자(name, created_at)를 조회합니다."""
+
+    @abstractmethod
+    def insert_blocked_users(self, rows):
+        """차단 사용자 여러 명을 한 번에 저장합니다. (이미 있으면 덮어씀)"""
+
+    @abstractmethod
+    def delete_blocked_user(self, name):
+        """사용자의 차단을 해제합니다."""
+
+# keyset 조회 조건 (정렬 키 값이 key_values인 행 다음부터)
+def keyset_filter(keys, key_values, desc):
+    """(created_at, id)처럼 1~2개 정렬 키에 대해 key_values 다음 행을 고르는 or_ 필터 식을 반환합니다."""
+    op = 'lt' if desc else 'gt'
+    values = [f'"{value}"' if isinstance(value, str) else value for value in key_values]
+    if len(keys) == 1:
+        return f'{keys[0]}.{op}.{values[0]}'
+    # 첫 번째 키가 같은 행은 두 번째 키로 순서를 구분
+    return f'{keys[0]}.{op}.{values[0]},and({keys[0]}.eq.{values[0]},{keys[1]}.{op}.{values[1]})'
+
+# Supabase 저장소 (테이블 정의: schema.sql)
+class SupabaseStorage(Storage):
+    def __init__(self, client):
+        self.client = client
+
+    def _select_all(self, build_query, keys, desc=False):
+        # 응답이 SUPABASE_MAX_ROWS행에서 잘리므로, 꽉 찬 응답이면 마지막 행의 정렬 키 다음부터 이어서 조회
+        # (오프셋 대신 keyset을 사용해 조회 중 행이 추가/삭제되어도 건너뛰거나 중복되는 행이 없음)
+        rows = []
+        last = None
+        while True:
+            query = build_query()
+            if last is not None:
+                query = query.or_(keyset_filter(keys, [last[key] for key in keys], desc))
+            for key in keys:
+                query = query.order(key, desc=desc)
+            page = query.limit(SUPABASE_MAX_ROWS).execute().data
+            rows.extend(page)
+            if len(page) < SUPABASE_MAX_ROWS:
+                return rows
+            last = page[-1]
+
+    def fetch_posts(self, since=None):
+        def build_query():
+            query = self.client.table('post').select(POST_COLUMNS)
+            return query.gte('created_at', since) if since else query
+        return self._select_all(build_query, ('created_at', 'id'), desc=True)
+
+    def fetch_post_page(self, cursor, limit):
+        query = self.client.table('post').select(POST_COLUMNS)
+        if cursor:
+            # 같은 시각에 작성된 글은 id로 순서를 구분
+            query = query.or_(keyset_filter(('created_at', 'id'), cursor, desc=True))
+        return query.order('created_at', desc=True).order('id', desc=True).limit(limit).execute().data
+
+    def fetch_posts_by_ids(self, post_ids):
+        # ID 묶음별 요청은 서로 독립적이므로 동시에 실행
+        results = run_concurrently(*(
+            self.client.table('post').select(POST_COLUMNS).in_('id', post_ids[start:start + ID_BATCH_SIZE]).execute
+            for start in range(0, len(post_ids), ID_BATCH_SIZE)
+        ))
+        return [row for result in results for row in result.data]
+
+    def fetch_post_ids(self):
+        rows = self._select_all(lambda: self.client.table('post').select('id'), ('id',))
+        return {row['id'] for row in rows}
+
+    def count_posts(self, category=None):
+        query = self.client.table('post').select('id', count='exact')
+        if category:
+            query = query.eq('category', category)
+        return query.limit(1).execute().count
+
+    def count_answered_questions(self):
+        # reply!inner: 답글이 있는 게시물만 포함 (reply.id -> post.id 외래키)
+        return self.client.table('post').select('id, reply!inner(id)', count='exact').eq('category', '질문').limit(1).execute().count
+
+    def fetch_replies(self, post_ids=None, since=None):
+        if post_ids is None:
+            batches = [None]
+        else:
+            batches = [post_ids[start:start + ID_BATCH_SIZE] for start in range(0, len(post_ids), ID_BATCH_SIZE)]
+
+        def build_query(batch):
+            query = self.client.table('reply').select('reply_id, id, reply, created_at')
+            if batch is not None:
+                query = query.in_('id', batch)
+            if since:
+                query = query.gt('created_at', since)
+            return query
+
+        # 묶음별 조회는 서로 독립적이므로 동시에 실행 (같은 시각의 답글은 reply_id로 순서를 구분)
+        results = run_concurrently(*(
+            partial(self._select_all, partial(build_query, batch), ('created_at', 'reply_id'))
+            for batch in batches
+        ))
+        # 묶음별 결과를 작성순으로 다시 정렬
+        rows = [row for result in results for row in result]
+        if len(batches) > 1:
+            rows.sort(key=lambda row: parse_timestamp(row['created_at']))
+        return rows
+
+    def count_replies(self):
+        return self.client.table('reply').select('id', count='exact').limit(1).execute().count
+
+    def insert_posts(self, rows):
+        return self.client.table('post').insert(rows).execute().data
+
+    def delete_posts(self, post_ids):
+        self.client.table('post').delete().in_('id', post_ids).execute()
+
+    def insert_replies(self, rows):
+        return self.client.table('reply').insert(rows).execute().data
+
+    def fetch_notices(self):
+        return self.client.table('notice').select('id, type, content, created_at').order('created_at', desc=False).execute().data
+
+    def insert_notice(self, data):
+        self.client.table('notice').insert(data).execute()
+
+    def delete_notice(self, notice_id):
+        self.client.table('notice').delete().eq('id', notice_id).execute()
+
+    def fetch_blocked_users(self):
+        return self.client.table('blocked_user').select('name, created_at').execute().data
+
+    def insert_blocked_users(self, rows):
+        self.client.table('blocked_user').upsert(rows).execute()
+
+    def delete_blocked_user(self, name):
+        self.client.table('blocked_user').delete().eq('name', name).execute()
+
+# SQLite 연결 풀 크기 (동시에 실행되는 저장소 요청 수와 같게)
+SQLITE_POOL_SIZE = IO_MAX_WORKERS
+
+# SQLite 저장소 (로컬/오프라인 배포 및 벤치마크용)
+class SQLiteStorage(Storage):
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS post (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            category TEXT NOT NULL,
+            text TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS reply (
+            reply_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            id INTEGER NOT NULL REFERENCES post(id) ON DELETE CASCADE,
+            reply TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_post_created ON post (created_at DESC, id DESC);
+        CREATE INDEX IF NOT EXISTS idx_reply_post ON reply (id, created_at);
+        CREATE INDEX IF NOT EXISTS idx_reply_created ON reply (created_at);
+        CREATE TABLE IF NOT EXISTS notice (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            type TEXT NOT NULL,
+            content TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS blocked_user (
+            name TEXT PRIMARY KEY,
+            created_at TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, path, pool_size=SQLITE_POOL_SIZE):
+        self.path = path
+        # 프로세스 전체가 공유하는 연결 풀 (Streamlit은 실행마다 새 스레드를 쓰므로 스레드별 연결은 재사용되지 않음)
+        # 동시에 최대 pool_size개 연결을 사용하며, WAL 모드로 읽기와 쓰기가 서로 막지 않음
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        with self._connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self.SCHEMA)
+
+    def _open(self):
+        conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    @contextmanager
+    def _connection(self):
+        # 풀에서 쉬고 있는 연결을 빌려 쓰고 돌려줌 (모두 사용 중이면 반납될 때까지 대기)
+        with self._slots:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._open()
+            try:
+                yield conn
+            finally:
+                self._idle.put(conn)
+
+    @contextmanager
+    def _transaction(self):
+        # 하나의 트랜잭션으로 저장 (하나라도 실패하면 모두 취소)
+        with self._connection() as conn, conn:
+            yield conn
+
+    def _query(self, sql, params=()):
+        with self._connection() as conn:
+            return [dict(row) for row in conn.execute(sql, params).fetchall()]
+
+    def _scalar(self, sql, params=()):
+        with self._connection() as conn:
+            return conn.execute(sql, params).fetchone()[0]
+
+    def fetch_posts(self, since=None):
+        if since:
+            return self._query(f"SELECT {POST_COLUMNS} FROM post WHERE created_at >= ? ORDER BY created_at DESC", (since,))
+        return self._query(f"SELECT {POST_COLUMNS} FROM post ORDER BY created_at DESC")
+
+    def fetch_post_page(self, cursor, limit):
+        if cursor:
+            created_at, post_id = cursor
+            return self._query(
+                f"SELECT {POST_COLUMNS} FROM post WHERE created_at < ? OR (created_at = ? AND id < ?) "
+                "ORDER BY created_at DESC, id DESC LIMIT ?",
+                (created_at, created_at, post_id, limit),
+            )
+        return self._query(f"SELECT {POST_COLUMNS} FROM post ORDER BY created_at DESC, id DESC LIMIT ?", (limit,))
+
+    def fetch_posts_by_ids(self, post_ids):
+        rows = []
+        for start in range(0, len(post_ids), ID_BATCH_SIZE):
+            batch = post_ids[start:start + ID_BATCH_SIZE]
+            placeholders = ','.join('?' * len(batch))
+            rows.extend(self._query(f"SELECT {POST_COLUMNS} FROM post WHERE id IN ({placeholders})", batch))
+        return rows
+
+    def fetch_post_ids(self):
+        return {row['id'] for row in self._query("SELECT id FROM post")}
+
+    def count_posts(self, category=None):
+        if category:
+            return self._scalar("SELECT COUNT(*) FROM post WHERE category = ?", (category,))
+        return self._scalar("SELECT COUNT(*) FROM post")
+
+    def count_answered_questions(self):
+        return self._scalar(
+            "SELECT COUNT(*) FROM post WHERE category = '질문' AND EXISTS (SELECT 1 FROM reply WHERE reply.id = post.id)"
+        )
+
+    def fetch_replies(self, post_ids=None, since=None):
+        if post_ids is None:
+            batches = [None]
+        else:
+            batches = [post_ids[start:start + ID_BATCH_SIZE] for start in range(0, len(post_ids), ID_BATCH_SIZE)]
+        rows = []
+        for batch in batches:
+            conditions, params = [], []
+            if batch is not None:
+                conditions.append(f"id IN ({','.join('?' * len(batch))})")
+                params.extend(batch)
+            if since:
+                conditions.append("created_at > ?")
+                params.append(since)
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            rows.extend(self._query(f"SELECT reply_id, id, reply, created_at FROM reply {where} ORDER BY created_at, reply_id", params))
+        return rows
+
+    def count_replies(self):
+        return self._scalar("SELECT COUNT(*) FROM reply")
+
+    def insert_posts(self, rows):
+        saved = []
+        with self._transaction() as conn:
+            for data in rows:
+                cursor = conn.execute(
+                    "INSERT INTO post (name, category, text, created_at) VALUES (?, ?, ?, ?)",
+                    (data['name'], data['category'], data['text'], data['created_at']),
+                )
+                saved.append({'id': cursor.lastrowid, **data})
+        return saved
+
+    def delete_posts(self, post_ids):
+        with self._transaction() as conn:
+            conn.execute(f"DELETE FROM post WHERE id IN ({','.join('?' * len(post_ids))})", list(post_ids))
+
+    def insert_replies(self, rows):
+        saved = []
+        with self._transaction() as conn:
+            for data in rows:
+                cursor = conn.execute(
+                    "INSERT INTO reply (id, reply, created_at) VALUES (?, ?, ?)",
+                    (data['id'], data['reply'], data['created_at']),
+                )
+                saved.append({'reply_id': cursor.lastrowid, **data})
+        return saved
+
+    def fetch_notices(self):
+        return self._query("SELECT id, type, content, created_at FROM notice ORDER BY created_at")
+
+    def insert_notice(self, data):
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO notice (type, content, created_at) VALUES (?, ?, ?)",
+                (data['type'], data['content'], data['created_at']),
+            )
+
+    def delete_notice(self, notice_id):
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM notice WHERE id = ?", (notice_id,))
+
+    def fetch_blocked_users(self):
+        return self._query("SELECT name, created_at FROM blocked_user")
+
+    def insert_blocked_users(self, rows):
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO blocked_user (name, created_at) VALUES (?, ?)",
+                [(data['name'], data['created_at']) for data in rows],
+            )
+
+    def delete_blocked_user(self, name):
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM blocked_user WHERE name = ?", (name,))
+
+# 성능 측정 설정 (최근 측정값 보관 개수, 느린 호출로 표시할 기준 시간(초))
+PERF_BUFFER_SIZE = 5000
+PERF_SLOW_THRESHOLD = 0.5
+PERF_SLOW_LIMIT = 10
+PERF_KIND_LABELS = {"storage": "저장소", "load": "로드", "render": "렌더링", "rerun": "재실행"}
+PERF_CACHE_LABELS = {
+    "feed_snapshot": "게시물 스냅샷",
+    "post_page": "피드 페이지",
+    "post_stats": "게시물 통계",
+    "render_card": "카드 HTML",
+}
+
+# 백분위수 계산 함수
+def percentile(sorted_values, pct):
+    """오름차순 목록의 nearest-rank 백분위수를 반환합니다. (빈 목록이면 None)"""
+    if not sorted_values:
+        return None
+    rank = max(-(-pct * len(sorted_values) // 100), 1)
+    return sorted_values[rank - 1]
+
+# 프로세스 전체가 공유하는 성능 측정값
+class PerfMonitor:
+    """저장소 호출, 로드, 렌더링, 재실행(전체 실행과 fragment 단독 실행)의 소요 시간과 캐시 적중 수를 모읍니다.
+
+    측정값은 최근 PERF_BUFFER_SIZE건만 링 버퍼에 보관하고 (백분위수, 느린 호출 목록용),
+    호출 수와 캐시 조회 수는 서버 시작 후 누적합니다. 여러 세션과 작업 스레드에서 호출됩니다.
+    """
+
+    def __init__(self, size=PERF_BUFFER_SIZE):
+        self._lock = threading.Lock()
+        self._samples = deque(maxlen=size)  # (구분, 이름, 소요 시간(초), 크기, 기록 시각 epoch)
+        self._calls = {}  # (구분, 이름) -> [호출 수, 오류 수]
+        self._cache = {}  # 캐시 이름 -> [조회 수, 적중 실패 수]
+        self.started_at = time.time()
+
+    def record(self, kind, name, seconds, size=None, error=False):
+        """측정값 하나를 기록합니다. size는 저장소 호출이면 행 수, 렌더링이면 HTML 글자 수입니다."""
+        with self._lock:
+            self._samples.append((kind, name, seconds, size, time.time()))
+            counts = self._calls.setdefault((kind, name), [0, 0])
+            counts[0] += 1
+            if error:
+                counts[1] += 1
+
+    def cache_lookup(self, name, hit=True):
+        with self._lock:
+            counts = self._cache.setdefault(name, [0, 0])
+            counts[0] += 1
+            if not hit:
+                counts[1] += 1
+
+    def cache_miss(self, name):
+        """조회 후에 적중 실패로 판명된 경우 기록합니다. (st.cache_data 함수 본문이 실행된 경우)"""
+        with self._lock:
+            self._cache.setdefault(name, [0, 0])[1] += 1
+
+    def summary(self):
+        """구분/항목별 누적 호출 수와 최근 소요 시간 백분위수, 캐시 적중률, 최근 느린 호출을 반환합니다."""
+        with self._lock:
+            samples = list(self._samples)
+            calls = {key: tuple(counts) for key, counts in self._calls.items()}
+            cache = {name: tuple(counts) for name, counts in self._cache.items()}
+
+        durations = {}
+        kind_durations = {}
+        sizes = {}
+        for kind, name, seconds, size, _ in samples:
+            durations.setdefault((kind, name), []).append(seconds)
+            kind_durations.setdefault(kind, []).append(seconds)
+            if size is not None:
+                sizes.setdefault((kind, name), []).append(size)
+
+        timings = []
+        for (kind, name), (count, errors) in sorted(calls.items()):
+            recent = sorted(durations.get((kind, name), []))
+            recent_sizes = sizes.get((kind, name))
+            timings.append({
+                'kind': kind,
+                'name': name,
+                'calls': count,
+                'errors': errors,
+                'recent': len(recent),
+                'p50': percentile(recent, 50),
+                'p95': percentile(recent, 95),
+                'p99': percentile(recent, 99),
+                'max': recent[-1] if recent else None,
+                'avg_size': sum(recent_sizes) / len(recent_sizes) if recent_sizes else None,
+            })
+
+        slow = sorted((sample for sample in samples if sample[2] >= PERF_SLOW_THRESHOLD), key=lambda s: -s[2])
+        kinds = {}
+        for kind, values in kind_durations.items():
+            values.sort()
+            kinds[kind] = {'count': len(values), 'p50': percentile(values, 50), 'p95': percentile(values, 95)}
+
+        return {
+            'samples': len(samples),
+            'kinds': kinds,  # 구분별 (전체 항목 합산) 최근 소요 시간
+            'timings': timings,
+            'cache': {
+                name: {'lookups': lookups, 'misses': misses, 'hit_ratio': (lookups - misses) / lookups if lookups else None}
+                for name, (lookups, misses) in sorted(cache.items())
+            },
+            'slow': slow[:PERF_SLOW_LIMIT],
+        }
+
+@st.cache_resource
+def get_perf_monitor():
+    return PerfMonitor()
+
+perf_monitor = get_perf_monitor()
+
+# 저장소 메서드별 대상 테이블 (성능 측정 항목 이름용)
+STORAGE_METHOD_TABLES = {
+    'fetch_posts': 'post',
+    'fetch_post_page': 'post',
+    'fetch_posts_by_ids': 'post',
+    'fetch_post_ids': 'post',
+    'count_posts': 'post',
+    'count_answered_questions': 'post',
+    'insert_posts': 'post',
+    'delete_posts': 'post',
+    'fetch_replies': 'reply',
+    'count_replies': 'reply',
+    'insert_replies': 'reply',
+    'fetch_notices': 'notice',
+    'insert_notice': 'notice',
+    'delete_notice': 'notice',
+    'fetch_blocked_users': 'blocked_user',
+    'insert_blocked_users': 'blocked_user',
+    'delete_blocked_user': 'blocked_user',
+}
+
+# 성능 측정 저장소 래퍼
+class InstrumentedStorage:
+    """저장소 호출마다 소요 시간과 반환 행 수를 '테이블.메서드' 이름으로 기록합니다."""
+
+    def __init__(self, storage, monitor):
+        self._storage = storage
+        self._monitor = monitor
+
+    def __getattr__(self, name):
+        method = getattr(self._storage, name)
+        table = STORAGE_METHOD_TABLES.get(name)
+        if table is None:
+            return method
+
+        label = f"{table}.{name}"
+
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                result = method(*args, **kwargs)
+            except Exception:
+                self._monitor.record('storage', label, time.perf_counter() - started, error=True)
+                raise
+            size = len(result) if isinstance(result, (list, set, dict)) else None
+            self._monitor.record('storage', label, time.perf_counter() - started, size)
+            return result
+
+        # 다음 호출부터는 __getattr__를 거치지 않도록 저장
+        setattr(self, name, timed)
+        return timed
+
+# 저장소 초기화 (Supabase 설정이 없으면 모든 사용자가 공유하는 SQLite 파일로 대체)
+# 설정된 Supabase에 연결할 수 없을 때는 SQLite로 바꾸지 않음 (글이 두 저장소에 나뉘어 저장되고 다시 합칠 방법이 없으므로,
+# 장애 중에는 마지막으로 성공한 조회 결과를 보여주고 쓰기는 대기열에서 재시도함)
+@st.cache_resource
+def init_storage(backend, sqlite_path):
+    if backend == "supabase" and SUPABASE_URL and SUPABASE_KEY:
+        return InstrumentedStorage(SupabaseStorage(create_client(SUPABASE_URL, SUPABASE_KEY)), get_perf_monitor())
+    try:
+        return InstrumentedStorage(SQLiteStorage(sqlite_path), get_perf_monitor())
+    except sqlite3.Error:
+        return None
+
+storage = init_storage(STORAGE_BACKEND, SQLITE_PATH)
+
+# 테이블별 데이터 버전 카운터 (프로세스 전체 공유)
+class TableVersions:
+    """테이블별 버전 번호를 관리합니다. 로더의 캐시 키에 포함되어 쓰기 후 해당 테이블의 캐시만 무효화합니다."""
+
+    def __init__(self, tables):
+        self._lock = threading.Lock()
+        self._versions = {table: 0 for table in tables}
+
+    def get(self, table):
+        return self._versions[table]
+
+    def bump(self, *tables):
+        with self._lock:
+            for table in tables:
+                self._versions[table] += 1
+
+@st.cache_resource
+def get_table_versions():
+    return TableVersions(['post', 'reply', 'notice', 'blocked_user'])
+
+table_versions = get_table_versions()
+
+# ISO 형식 시각 문자열 변환 함수
+def parse_timestamp(value):
+    """DB의 ISO 형식 시각 문자열을 UTC 기준 datetime 객체로 변환합니다.
+    
+    시간대가 없는 시각(이전 버전이 저장한 값)은 Postgres와 같이 UTC로 간주합니다.
+    """
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+# 답글 행을 Reply 레코드로 변환하는 함수
+def build_reply(reply_data):
+    """DB의 답글 행으로 Reply를 만듭니다. (시각은 여기서 한 번만 파싱)"""
+    return Reply(reply_data['reply'], parse_timestamp(reply_data['created_at']).timestamp(), reply_data.get('reply_id'))
+
+# 게시물 행을 Post 레코드로 변환하는 함수
+def build_post(post, replies, pending=False):
+    """DB의 게시물 행과 답글 목록으로 Post를 만듭니다. (시각은 여기서 한 번만 파싱)"""
+    return Post(
+        id=post['id'],
+        name=post['name'],
+        type=post['category'],  # category -> type으로 매핑
+        text=post['text'],
+        created_at=post['created_at'],  # 페이지 커서용 원본 시각
+        created_ts=parse_timestamp(post['created_at']).timestamp(),
+        replies=tuple(replies),
+        pending=pending,
+    )
+
+# 저장 대기 중인 게시물을 Post 레코드로 변환하는 함수
+def build_pending_post(data):
+    """쓰기 대기열에 있는 게시물 데이터로 '저장 중' 상태의 Post를 만듭니다."""
+    return build_post({'id': None, **data}, (), pending=True)
+
+# 검색 결과 최대 개수
+SEARCH_RESULT_LIMIT = 50
+
+# 검색용 텍스트 정규화 함수
+def normalize_text(text):
+    """전각/반각 등을 통일하고 소문자로 바꿉니다."""
+    return unicodedata.normalize('NFKC', text).lower()
+
+# 게시물 검색 색인
+class SearchIndex:
+    """문자 2-gram/3-gram 역색인입니다. 형태소 분석기 없이 한국어 부분 문자열 검색을 지원합니다.
+    
+    n-gram 색인으로 후보 문서를 좁힌 뒤 실제 부분 문자열 일치를 확인하고,
+    검색어 출현 빈도와 작성 시각으로 순위를 매깁니다.
+    """
+
+    def __init__(self):
+        self._postings = {}  # n-gram -> 문서 id 집합
+        self._chars = {}  # 글자 -> 그 글자를 포함한 n-gram 집합 (한 글자 검색용)
+        self._docs = {}  # 문서 id -> (정규화된 본문, 작성 시각 epoch)
+
+    @staticmethod
+    def _ngrams(word, n):
+        return {word[i:i + n] for i in range(len(word) - n + 1)}
+
+    def _doc_grams(self, text):
+        grams = set()
+        for word in text.split():
+            if len(word) == 1:
+                grams.add(word)
+            grams |= self._ngrams(word, 2) | self._ngrams(word, 3)
+        return grams
+
+    def add(self, doc_id, text, created_ts=0.0):
+        """문서를 색인에 추가합니다. 이미 있으면 새 내용으로 교체합니다."""
+        self.remove(doc_id)
+        text = normalize_text(text)
+        self._docs[doc_id] = (text, created_ts)
+        for gram in self._doc_grams(text):
+            postings = self._postings.get(gram)
+            if postings is None:
+                postings = self._postings[gram] = set()
+                for ch in set(gram):
+                    self._chars.setdefault(ch, set()).add(gram)
+            postings.add(doc_id)
+
+    def remove(self, doc_id):
+        doc = self._docs.pop(doc_id, None)
+        if doc is None:
+            return
+        for gram in self._doc_grams(doc[0]):
+            postings = self._postings[gram]
+            postings.discard(doc_id)
+            if not postings:
+                del self._postings[gram]
+                for ch in set(gram):
+                    self._chars[ch].discard(gram)
+
+    def _candidates(self, term):
+        if len(term) == 1:
+            return set().union(*(self._postings[gram] for gram in self._chars.get(term, ())))
+        grams = self._ngrams(term, 3) if len(term) >= 3 else {term}
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        return postings[0].intersection(*postings[1:])
+
+    def search(self, query, limit=SEARCH_RESULT_LIMIT):
+        """모든 검색어를 포함하는 문서 id를 점수순으로 최대 limit개 반환합니다."""
+        terms = normalize_text(query).split()
+        if not terms:
+            return []
         
-        # 데이터 형식 변환
-        posts = []
-        for post in response.data:
-            # 답글 로드
-            replies = load_replies_from_supabase(post['id'])
+        candidates = None
+        for term in sorted(terms, key=len, reverse=True):
+            ids = self._candidates(term)
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return []
+        
+        now = time.time()
+        scored = []
+        for doc_id in candidates:
+            text, created_ts = self._docs[doc_id]
+            counts = [text.count(term) for term in terms]
+            if not all(counts):
+                continue
+            # 출현 빈도에 최근 글 가중치(1주일 단위로 감소)를 곱한 점수
+            age_days = max(now - created_ts, 0) / 86400
+            scored.append((sum(counts) / (1 + age_days / 7), created_ts, doc_id))
+        return [doc_id for _, _, doc_id in heapq.nlargest(limit, scored)]
+
+# 게시물의 검색 대상 텍스트 (작성자, 본문, 답글)
+def post_search_text(post):
+    return ' '.join([post.name, post.text] + [reply.text for reply in post.replies])
+
+# 검색어 강조 함수
+def highlight_html(text, terms):
+    """text를 HTML 이스케이프하고 검색어와 일치하는 부분을 <mark>로 감쌉니다. (검색 색인과 같이 정규화해서 비교)"""
+    terms = [normalize_text(term) for term in terms if term]
+    if not terms:
+        return html.escape(text)
+    
+    # 검색과 같은 기준으로 일치시키도록 글자마다 정규화하고, 정규화된 위치 -> 원문 위치를 기록
+    normalized = []
+    origins = []
+    for i, ch in enumerate(text):
+        ch = normalize_text(ch)
+        normalized.append(ch)
+        origins.extend([i] * len(ch))
+    
+    pattern = re.compile('|'.join(re.escape(term) for term in sorted(terms, key=len, reverse=True)))
+    parts = []
+    last = 0
+    for match in pattern.finditer(''.join(normalized)):
+        start = origins[match.start()]
+        end = origins[match.end() - 1] + 1
+        if start < last:
+            continue
+        parts.append(html.escape(text[last:start]))
+        parts.append(f'<mark>{html.escape(text[start:end])}</mark>')
+        last = end
+    parts.append(html.escape(text[last:]))
+    return ''.join(parts)
+
+# 답변 대기 목록에 표시할 최대 질문 수
+INBOX_SIZE = 20
+
+# 답변 대기 질문 색인
+class QuestionIndex:
+    """답변을 기다리는 질문을 작성 시각순으로, 답변된 질문은 첫 답변까지 걸린 시간순으로 유지합니다.
+    
+    게시물이 바뀔 때마다 해당 질문만 갱신하므로 전체 목록을 다시 훑지 않습니다.
+    """
+
+    def __init__(self):
+        self._waiting = []  # (작성 시각 epoch, 게시물 id) 오름차순
+        self._waiting_since = {}  # 게시물 id -> 작성 시각 epoch
+        self._latencies = []  # 첫 답변까지 걸린 시간(초) 오름차순
+        self._latency_of = {}  # 게시물 id -> 첫 답변까지 걸린 시간(초)
+
+    def update(self, post_id, created_ts, first_reply_ts=None):
+        """질문을 색인에 반영합니다. first_reply_ts가 없으면 답변 대기 질문입니다."""
+        self.remove(post_id)
+        if first_reply_ts is None:
+            self._waiting_since[post_id] = created_ts
+            bisect.insort(self._waiting, (created_ts, post_id))
+        else:
+            latency = max(first_reply_ts - created_ts, 0)
+            self._latency_of[post_id] = latency
+            bisect.insort(self._latencies, latency)
+
+    def remove(self, post_id):
+        created_ts = self._waiting_since.pop(post_id, None)
+        if created_ts is not None:
+            self._waiting.pop(bisect.bisect_left(self._waiting, (created_ts, post_id)))
+        latency = self._latency_of.pop(post_id, None)
+        if latency is not None:
+            self._latencies.pop(bisect.bisect_left(self._latencies, latency))
+
+    def summary(self, limit=INBOX_SIZE):
+        """답변 대기 수, 가장 오래 기다린 질문들의 (작성 시각, id), 첫 답변 시간 통계를 반환합니다."""
+        return {
+            'count': len(self._waiting),
+            'oldest_ts': self._waiting[0][0] if self._waiting else None,
+            'oldest': self._waiting[:limit],
+            'answered': len(self._latencies),
+            'p50': percentile(self._latencies, 50),
+            'p95': percentile(self._latencies, 95),
+        }
+
+# 게시물 스냅샷 갱신 주기 (초, 주기가 지나면 기존 스냅샷을 반환하면서 백그라운드에서 갱신)
+FEED_SYNC_INTERVAL = 5
+# 백그라운드 갱신 중 쓰기가 반영되어 조회 결과를 버린 경우 바로 다시 시도하는 횟수
+FEED_REFRESH_ATTEMPTS = 3
+# 마지막 갱신 성공 후 이 시간(초)이 지나면 '데이터 갱신 지연' 표시
+FEED_STALE_AFTER = 30
+# 스냅샷을 처음 로드하거나 전체 id/답글을 다시 조회할 때의 제한 시간 (초, 큰 게시판은 전체 행을 여러 번에 나눠 받음)
+FEED_LOAD_TIMEOUT = 120
+# 개수가 같아도 id 목록을 전체 대조하는 주기 (초, 삭제와 늦게 도착한 글이 겹치는 경우 대비)
+FEED_RECONCILE_INTERVAL = 60
+
+# 공유 게시물 목록의 보관 버전 수 (세션이 보고 있던 이전 버전을 이 개수만큼 유지)
+FEED_VERSIONS_KEPT = 8
+
+# 게시물 목록 버전 저장소
+class FeedVersions:
+    """최신순 게시물 목록의 불변 버전을 번호로 보관합니다.
+    
+    세션에는 버전 번호만 저장하므로 메모리 사용량은 세션 수가 아니라 보관 중인 버전 수에 비례합니다.
+    게시물 레코드는 버전 사이에 공유되고, 바뀐 게시물만 새로 만들어집니다.
+    """
+
+    def __init__(self, keep=FEED_VERSIONS_KEPT):
+        self._lock = threading.Lock()
+        self._keep = keep
+        self._versions = OrderedDict({0: ()})
+        self.latest = 0
+
+    def __contains__(self, version):
+        with self._lock:
+            return version in self._versions
+
+    def get(self, version=None):
+        """(버전, 게시물 튜플)을 반환합니다. 요청한 버전이 없으면 최신 버전을 반환합니다."""
+        with self._lock:
+            if version not in self._versions:
+                version = self.latest
+            return version, self._versions[version]
+
+    def publish(self, posts):
+        """게시물 목록을 새 버전으로 등록하고 버전 번호를 반환합니다."""
+        with self._lock:
+            return self._publish(tuple(posts))
+
+    def update(self, change):
+        """최신 목록에 change를 적용한 결과를 새 버전으로 등록합니다. (동시에 수정해도 유실 없음)"""
+        with self._lock:
+            return self._publish(tuple(change(self._versions[self.latest])))
+
+    def _publish(self, posts):
+        self.latest += 1
+        self._versions[self.latest] = posts
+        while len(self._versions) > self._keep:
+            self._versions.popitem(last=False)
+        return self.latest
+
+# 프로세스 전체가 공유하는 게시물 스냅샷
+class FeedSnapshot:
+    """저장소의 게시물/답글 테이블 메모리 사본을 증분 동기화합니다.
+    
+    갱신할 때는 마지막으로 본 created_at(워터마크) 이후의 행만 조회하고,
+    삭제 여부는 행 개수를 비교해 다를 때만 id 목록을 대조합니다.
+    갱신 주기가 지나면 기존 스냅샷을 바로 반환하고 백그라운드 스레드 하나가 갱신하며 (stale-while-revalidate),
+    갱신에 실패하면 마지막으로 성공한 스냅샷을 계속 사용합니다.
+    저장소를 조회하는 동안에는 스냅샷 잠금을 잡지 않으므로, 갱신을 기다릴 필요가 없는 세션은 기존 스냅샷을 바로 읽습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._sync_lock = threading.Lock()  # 저장소 조회는 한 번에 하나만 (동시에 요청한 세션은 먼저 시작한 조회 결과를 사용)
+        self._built = {}  # 게시물 id -> Post (원본 행은 보관하지 않고 새 행은 Post와 비교)
+        self._orphan_replies = {}  # 스냅샷에 아직 없는 게시물 id -> Reply 목록
+        self._reply_count = 0
+        self._post_watermark = None
+        self._reply_watermark = None
+        self._feed = ()
+        self.versions = FeedVersions()  # 다시 만들 때마다 _feed를 새 버전으로 등록
+        self._feed_keys = []  # _feed와 같은 순서의 정렬 키 (페이지 커서 위치 탐색용)
+        self._index = SearchIndex()
+        self._questions = QuestionIndex()
+        self._synced_at = None
+        self._synced_versions = None
+        self._reconciled_at = None
+        self._generation = 0  # 스냅샷 내용이 바뀔 때마다 증가 (잠금 없이 조회한 결과의 유효성 확인용)
+        self._refreshing = False  # 백그라운드 갱신 실행 중 여부
+        self._fresh_at = None  # 마지막으로 갱신에 성공한 시각 (epoch)
+        self.last_error = None  # 마지막 갱신 실패 메시지 (성공하면 None)
+
+    def get(self, versions, pinned=None):
+        """스냅샷을 필요 시 갱신한 뒤 (버전, 최신순 게시물 튜플)을 반환합니다.
+        
+        pinned 버전이 아직 보관 중이면 갱신하지 않고 그 버전을 반환합니다.
+        """
+        if pinned is None or pinned not in self.versions:
+            self._refresh(versions)
+        return self.versions.get(pinned)
+
+    def search(self, query, versions, limit=SEARCH_RESULT_LIMIT):
+        """스냅샷을 필요 시 갱신한 뒤 검색어와 일치하는 게시물을 점수순으로 반환합니다."""
+        self._refresh(versions)
+        with self._lock:
+            return [self._built[post_id] for post_id in self._index.search(query, limit)]
+
+    def loaded(self, versions):
+        """스냅샷이 로드되었으면 True를 반환합니다.
+        
+        아직 로드되지 않았으면 공유 스레드 풀에서 처음 로드를 시작하고 (이미 진행 중이면 그대로 두고) False를 반환합니다.
+        """
+        if self._fresh_at is not None:
+            return True
+        self._start_refresh(versions)
+        return False
+
+    @property
+    def loading(self):
+        """처음 로드가 백그라운드에서 진행 중이면 True입니다."""
+        return self._fresh_at is None and self._refreshing
+
+    def staleness(self):
+        """마지막으로 갱신에 성공한 뒤 지난 시간(초)을 반환합니다. 아직 로드되지 않았으면 None을 반환합니다.
+        
+        갱신 주기마다 다시 조회하므로, 갱신이 실패하고 있을 때(last_error)만 이 값이 계속 커집니다.
+        """
+        if self._fresh_at is None:
+            return None
+        return time.time() - self._fresh_at
+
+    def _must_wait(self, versions):
+        # 처음 로드하거나, 이 프로세스의 쓰기가 스냅샷에 반영되지 못한 경우에만 기다려서 갱신
+        return self._fresh_at is None or versions != self._synced_versions
+
+    def _refresh(self, versions):
+        with self._lock:
+            blocking = self._must_wait(versions)
+            expired = self._synced_at is None or time.monotonic() - self._synced_at >= FEED_SYNC_INTERVAL
+        perf_monitor.cache_lookup('feed_snapshot', hit=not blocking)
+        if not blocking:
+            if expired:
+                self._start_refresh(versions)
+            return
+        
+        # 같은 갱신을 기다리는 세션은 먼저 시작한 조회가 끝나면 다시 확인 (끝났으면 조회하지 않음)
+        with self._sync_lock:
+            with self._lock:
+                if not self._must_wait(versions):
+                    return
+                # 실패하더라도 다음 갱신 주기까지는 기존 스냅샷을 사용 (로드된 적이 없으면 오류 전달)
+                self._synced_at = time.monotonic()
+                self._synced_versions = versions
+            try:
+                self._timed_sync()
+            except Exception:
+                if self._fresh_at is None:
+                    raise
+
+    def _start_refresh(self, versions):
+        # 공유 스레드 풀에서 갱신 (풀 안에서는 요청을 순서대로 보내므로 다른 요청의 작업 스레드를 더 차지하지 않음)
+        with self._lock:
+            if self._refreshing:
+                return
+            self._synced_at = time.monotonic()
+            if self._fresh_at is None:
+                self._synced_versions = versions
+            self._refreshing = True
+        try:
+            get_io_executor().submit(self._refresh_in_background)
+        except Exception:
+            self._refreshing = False
+            raise
+
+    def _refresh_in_background(self):
+        try:
+            # 다른 세션이 기다리며 갱신하고 있으면 그 결과를 사용 (풀의 작업 스레드는 대기하지 않음)
+            if not self._sync_lock.acquire(blocking=False):
+                return
+            try:
+                for _ in range(FEED_REFRESH_ATTEMPTS):
+                    if self._timed_sync():
+                        break
+            finally:
+                self._sync_lock.release()
+        except Exception:
+            pass  # 오류는 last_error에 기록됨, 다음 갱신 주기에 다시 시도
+        finally:
+            self._refreshing = False
+
+    def _timed_sync(self):
+        started = time.perf_counter()
+        try:
+            applied = self._sync()
+        except Exception as e:
+            self.last_error = str(e)
+            perf_monitor.record('load', 'feed_sync', time.perf_counter() - started, error=True)
+            raise
+        perf_monitor.record('load', 'feed_sync', time.perf_counter() - started, len(self._feed))
+        return applied
+
+    def page(self, cursor, limit, versions):
+        """스냅샷이 만들어져 있으면 갱신 후 커서 이전의 게시물을 최대 limit개 반환합니다.
+        
+        (게시물 목록, 다음 페이지 커서)를 반환하며, 아직 로드되지 않았으면 백그라운드 로드를 시작하고 None을 반환합니다.
+        """
+        if not self.loaded(versions):
+            return None
+        self._refresh(versions)
+        with self._lock:
+            start = 0
+            if cursor:
+                created_at, post_id = cursor
+                start = bisect.bisect_right(self._feed_keys, self._sort_key(parse_timestamp(created_at).timestamp(), post_id))
+            posts = self._feed[start:start + limit]
+            next_cursor = None
+            if start + limit < len(self._feed):
+                next_cursor = (posts[-1].created_at, posts[-1].id)
+            return posts, next_cursor
+
+    def inbox(self, versions, limit=INBOX_SIZE):
+        """스냅샷을 필요 시 갱신한 뒤 답변 대기 질문 요약을 반환합니다. (posts: 오래 기다린 순 (게시물, 작성 시각))"""
+        self._refresh(versions)
+        with self._lock:
+            summary = self._questions.summary(limit)
+            summary['posts'] = [(self._built[post_id], created_ts) for created_ts, post_id in summary.pop('oldest')]
+            return summary
+
+    def stats(self, versions):
+        """스냅샷이 만들어져 있으면 갱신 후 게시물 통계를 반환합니다. 아니면 백그라운드 로드를 시작하고 None을 반환합니다."""
+        if not self.loaded(versions):
+            return None
+        self._refresh(versions)
+        with self._lock:
+            return count_post_stats(self._feed)
+
+    # 쓰기 결과 반영 (저장 직후 다시 조회하지 않고 스냅샷을 직접 수정)
+    def add_posts(self, rows):
+        """저장된 게시물 행을 스냅샷에 추가하고 게시물 테이블 버전을 올립니다."""
+        with self._lock:
+            if not self._bump_versions('post'):
+                return
+            for post in rows:
+                self._set_post(post)
+            self._merged({post['id'] for post in rows})
+
+    def add_replies(self, rows):
+        """저장된 답글 행을 스냅샷에 추가하고 답글 테이블 버전을 올립니다."""
+        with self._lock:
+            if not self._bump_versions('reply'):
+                return
+            changed_ids = set()
+            self._add_replies(rows, changed_ids)
+            self._merged(changed_ids)
+
+    def remove_posts(self, post_ids):
+        """삭제된 게시물과 그 답글(ON DELETE CASCADE)을 스냅샷에서 제거하고 버전을 올립니다."""
+        with self._lock:
+            if not self._bump_versions('post', 'reply'):
+                return
+            for post_id in post_ids:
+                self._drop_post(post_id)
+            self._merged(set(post_ids))
+
+    def _bump_versions(self, *tables):
+        # 버전을 올리고, 올리기 전 스냅샷이 최신 버전과 동기화되어 있었는지 반환
+        # (동기화된 적이 없거나 다른 변경이 밀려 있으면 직접 반영하지 않고 다음 조회 때 저장소에서 갱신)
+        versions = (table_versions.get('post'), table_versions.get('reply'))
+        in_sync = self._fresh_at is not None and self._synced_versions == versions
+        table_versions.bump(*tables)
+        return in_sync
+
+    def _merged(self, changed_ids):
+        self._rebuild(changed_ids)
+        self._synced_versions = (table_versions.get('post'), table_versions.get('reply'))
+
+    def _sync(self):
+        """저장소에서 바뀐 행을 조회해 스냅샷에 반영합니다.
+        
+        조회하는 동안에는 잠금을 풀어 두어 다른 세션이 기존 스냅샷을 읽을 수 있으며,
+        그 사이 쓰기 결과가 반영되어 스냅샷이 바뀌었으면 조회 결과를 버리고 False를 반환합니다.
+        """
+        with self._lock:
+            generation = self._generation
+            post_watermark = self._post_watermark
+            reply_watermark = self._reply_watermark
+            reconcile_due = self._reconciled_at is None or time.monotonic() - self._reconciled_at >= FEED_RECONCILE_INTERVAL
+        
+        # 증분 조회와 개수 확인은 서로 독립적이므로 동시에 요청
+        new_posts, new_replies, post_count, reply_count = run_concurrently(
+            partial(storage.fetch_posts, since=post_watermark),
+            partial(storage.fetch_replies, since=reply_watermark),
+            storage.count_posts,
+            storage.count_replies,
+            timeout=IO_TIMEOUT if post_watermark else FEED_LOAD_TIMEOUT,
+        )
+        
+        # 삭제 확인: 증분 조회 결과를 더한 개수가 다를 때만 전체 id 목록과 대조
+        # (개수 조회와 증분 조회 사이에 추가된 행은 개수 불일치로 드러나 다음 단계에서 보정됨)
+        with self._lock:
+            if self._generation != generation:
+                return False
+            new_ids = {post['id'] for post in new_posts}
+            expected_posts = len(self._built) + len(new_ids - self._built.keys())
+            expected_replies = self._reply_count + len(new_replies)
+        
+        db_ids = None
+        missing_posts = []
+        if post_watermark is None:
+            # 처음 로드할 때는 전체 게시물을 조회했으므로 그 id가 곧 전체 id 목록
+            db_ids = new_ids
+        elif post_count != expected_posts or reconcile_due:
+            db_ids, = run_concurrently(storage.fetch_post_ids, timeout=FEED_LOAD_TIMEOUT)
+            with self._lock:
+                if self._generation != generation:
+                    return False
+                missing_ids = db_ids - self._built.keys() - new_ids
+            # 워터마크 이전 시각으로 저장된 글 (서버 간 시계 차이 등)
+            missing_posts = storage.fetch_posts_by_ids(list(missing_ids))
+        all_replies = None
+        if reply_count != expected_replies:
+            all_replies, = run_concurrently(storage.fetch_replies, timeout=FEED_LOAD_TIMEOUT)
+        
+        with self._lock:
+            if self._generation != generation:
+                return False
+            changed_ids = set()
             
-            posts.append({
-                'id': post['id'],  # 실제 DB의 ID 사용
-                'db_id': post['id'],  # 삭제용 DB ID 저장
-                'name': post['name'],
-                'type': post['category'],  # category -> type으로 매핑
-                'text': post['text'],
-                'time': datetime.fromisoformat(post['created_at'].replace('Z', '+00:00')).strftime('%Y-%m-%d %H:%M'),
-                'replies': replies,  # Supabase에서 로드한 답변들
-                'status': 'answered' if replies else ('waiting' if post['category'] == '질문' else 'none')
-            })
-        return posts
+            # 워터마크 이후 게시물 (경계 시각의 글은 id로 중복 제거)
+            for post in [*new_posts, *missing_posts]:
+                if self._set_post(post):
+                    changed_ids.add(post['id'])
+            
+            if db_ids is not None:
+                self._reconciled_at = time.monotonic()
+                for post_id in self._built.keys() - db_ids:
+                    self._drop_post(post_id)
+                    changed_ids.add(post_id)
+            
+            # 워터마크 이후 답글 (개수가 맞지 않으면 전체 답글로 교체)
+            if all_replies is None:
+                self._add_replies(new_replies, changed_ids)
+            else:
+                for post_id, post in self._built.items():
+                    if post.replies:
+                        self._built[post_id] = replace(post, replies=())
+                        changed_ids.add(post_id)
+                self._orphan_replies = {}
+                self._reply_count = 0
+                self._reply_watermark = None
+                self._add_replies(all_replies, changed_ids)
+            
+            if changed_ids:
+                self._rebuild(changed_ids)
+            self._fresh_at = time.time()
+            self.last_error = None
+            return True
+
+    def _set_post(self, row):
+        # 게시물 행을 Post로 만들어 반영하고, 기존 Post와 달라졌으면 True를 반환 (답글은 기존 것을 유지)
+        current = self._built.get(row['id'])
+        if current is not None:
+            replies = current.replies
+        else:
+            replies = self._orphan_replies.pop(row['id'], ())
+        post = build_post(row, replies)
+        self._post_watermark = self._later(self._post_watermark, row['created_at'])
+        if post == current:
+            return False
+        self._built[row['id']] = post
+        return True
+
+    def _drop_post(self, post_id):
+        post = self._built.pop(post_id, None)
+        replies = post.replies if post is not None else self._orphan_replies.pop(post_id, ())
+        self._reply_count -= len(replies)
+
+    def _add_replies(self, replies, changed_ids):
+        added = {}  # 게시물 id -> 새 Reply 목록
+        seen = {}  # 게시물 id -> 이미 있는 답글 id 집합
+        for reply_data in replies:
+            post_id = reply_data['id']
+            reply = build_reply(reply_data)
+            if post_id not in seen:
+                post = self._built.get(post_id)
+                existing = post.replies if post is not None else self._orphan_replies.get(post_id, ())
+                seen[post_id] = {other.reply_id for other in existing}
+                added[post_id] = []
+            # 갱신과 쓰기 결과 반영이 같은 답글을 모두 가져온 경우 한 번만 추가
+            if reply.reply_id is not None:
+                if reply.reply_id in seen[post_id]:
+                    continue
+                seen[post_id].add(reply.reply_id)
+            added[post_id].append(reply)
+            self._reply_count += 1
+            self._reply_watermark = self._later(self._reply_watermark, reply_data['created_at'])
+        
+        for post_id, post_added in added.items():
+            if not post_added:
+                continue
+            post = self._built.get(post_id)
+            if post is None:
+                self._orphan_replies.setdefault(post_id, []).extend(post_added)
+                continue
+            self._built[post_id] = replace(post, replies=(*post.replies, *post_added))
+            changed_ids.add(post_id)
+
+    def _rebuild(self, changed_ids):
+        self._generation += 1
+        for post_id in changed_ids:
+            built = self._built.get(post_id)
+            if built is None:
+                self._index.remove(post_id)
+                self._questions.remove(post_id)
+                continue
+            self._index.add(post_id, post_search_text(built), built.created_ts)
+            if built.type == '질문':
+                first_reply_ts = min((reply.created_ts for reply in built.replies), default=None)
+                self._questions.update(post_id, built.created_ts, first_reply_ts)
+            else:
+                self._questions.remove(post_id)
+        self._feed = tuple(sorted(self._built.values(), key=lambda p: self._sort_key(p.created_ts, p.id)))
+        self._feed_keys = [self._sort_key(p.created_ts, p.id) for p in self._feed]
+        self.versions.publish(self._feed)
+
+    @staticmethod
+    def _sort_key(created_ts, post_id):
+        # 최신순 (created_at, id 내림차순)이 오름차순이 되도록 부호를 바꾼 키
+        return (-created_ts, -post_id)
+
+    @staticmethod
+    def _later(watermark, created_at):
+        if watermark is None or parse_timestamp(created_at) > parse_timestamp(watermark):
+            return created_at
+        return watermark
+
+@st.cache_resource
+def get_feed_snapshot():
+    return FeedSnapshot()
+
+# 로컬 저장 (fallback) 게시물 목록 (저장소가 없을 때 프로세스 전체가 공유)
+@st.cache_resource
+def get_local_feed():
+    return FeedVersions()
+
+def add_local_post(name, category, text):
+    """로컬 게시물 목록 맨 앞에 새 게시물을 추가한 버전을 만듭니다."""
+    def prepend(posts):
+        post = Post(
+            id=max((post.id for post in posts), default=0) + 1,
+            name=name,
+            type=category,
+            text=text,
+            created_at=datetime.now(timezone.utc).isoformat(),
+            created_ts=time.time(),
+        )
+        return (post, *posts)
+    
+    return get_local_feed().update(prepend)
+
+def add_local_replies(post_ids, reply_text):
+    """로컬 게시물들에 답글을 추가한 버전을 만듭니다."""
+    post_ids = set(post_ids)
+    reply = Reply(reply_text, time.time())
+    return get_local_feed().update(
+        lambda posts: (
+            replace(post, replies=(*post.replies, reply)) if post.id in post_ids else post
+            for post in posts
+        )
+    )
+
+def remove_local_posts(post_ids):
+    """로컬 게시물들을 뺀 버전을 만듭니다."""
+    post_ids = set(post_ids)
+    return get_local_feed().update(lambda posts: (post for post in posts if post.id not in post_ids))
+
+# 게시물 데이터 로드 함수
+def load_posts_from_supabase(version=None):
+    """공유 게시물 목록을 (버전, 최신순 게시물 튜플)로 반환합니다.
+    
+    version을 주면 그 버전이 보관되어 있는 동안 같은 목록을 반환합니다. (세션이 보던 목록 고정)
+    """
+    if not storage:
+        return get_local_feed().get(version)
+    
+    try:
+        return get_feed_snapshot().get((table_versions.get('post'), table_versions.get('reply')), version)
     except Exception as e:
         st.error(f"데이터 로드 중 오류가 발생했습니다: {e}")
+        return get_feed_snapshot().versions.get(version)
+
+# 마지막으로 성공한 조회 결과 (저장소 오류 시 빈 결과 대신 사용)
+class LastGoodResults:
+    """키별로 마지막으로 성공한 조회 결과를 보관합니다. (오래 쓰지 않은 키부터 밀려남)
+    
+    저장소 오류로 보관된 결과를 대신 반환하는 동안에는 staleness()로 결과가 얼마나 오래되었는지 알려줍니다.
+    """
+
+    def __init__(self, max_size):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._items = OrderedDict()
+        self._succeeded_at = None  # 마지막 조회 성공 시각 (epoch)
+        self._failing = False
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            if len(self._items) > self._max_size:
+                self._items.popitem(last=False)
+            self._succeeded_at = time.time()
+            self._failing = False
+
+    def get(self, key):
+        """조회 실패 후 보관된 결과를 반환합니다. 없으면 None을 반환합니다."""
+        with self._lock:
+            self._failing = True
+            return self._items.get(key)
+
+    def peek(self, key):
+        """조회 실패로 표시하지 않고 보관된 결과를 반환합니다. 없으면 None을 반환합니다."""
+        with self._lock:
+            return self._items.get(key)
+
+    def staleness(self):
+        """조회가 실패하고 있으면 마지막 성공 후 지난 시간(초)을, 아니면 None을 반환합니다."""
+        with self._lock:
+            if not self._failing or self._succeeded_at is None:
+                return None
+            return time.time() - self._succeeded_at
+
+@st.cache_resource
+def get_last_good_results():
+    return LastGoodResults(256)
+
+# 표시 중인 게시물 데이터의 갱신 지연 시간
+def feed_staleness():
+    """저장소 갱신이 실패해 이전 데이터를 표시하는 중이면 그 데이터가 얼마나 오래되었는지(초) 반환합니다."""
+    if not storage:
+        return None
+    snapshot = get_feed_snapshot()
+    ages = [
+        snapshot.staleness() if snapshot.last_error else None,
+        get_last_good_results().staleness(),
+        *(cache.staleness() for cache in get_moderation_cache().values()),
+    ]
+    return max((age for age in ages if age is not None), default=None)
+
+# 데이터 갱신 지연 표시 함수
+def render_stale_badge():
+    """이전 데이터를 FEED_STALE_AFTER초 넘게 표시하고 있으면 작은 '데이터 갱신 지연' 배지를 표시합니다."""
+    age = feed_staleness()
+    if age is not None and age >= FEED_STALE_AFTER:
+        st.markdown(
+            f'<span class="stale-badge" title="저장소에서 최신 데이터를 가져오지 못해 마지막으로 받은 데이터를 표시하고 있습니다.">'
+            f'⏳ 데이터 갱신 지연 · {format_duration(age)} 전 데이터</span>',
+            unsafe_allow_html=True,
+        )
+
+# 게시물 통계 집계 함수 (메모리의 게시물 목록용)
+def count_post_stats(posts):
+    """게시물 목록에서 전체/구분별/답변 상태별 개수를 집계합니다."""
+    categories = {}
+    answered = 0
+    for post in posts:
+        categories[post.type] = categories.get(post.type, 0) + 1
+        if post.type == '질문' and post.status == 'answered':
+            answered += 1
+    questions = categories.get('질문', 0)
+    return {'total': len(posts), 'categories': categories, 'answered': answered, 'waiting': questions - answered}
+
+# 게시물 통계 로드 함수
+def load_post_stats():
+    """저장소에서 전체/구분별/답변 상태별 게시물 수를 집계합니다. (피드와 별도 캐시)
+    
+    조회에 실패하면 마지막으로 성공한 집계를 반환합니다.
+    """
+    perf_monitor.cache_lookup('post_stats')
+    last_good = get_last_good_results()
+    versions = (table_versions.get('post'), table_versions.get('reply'))
+    # 공유 스냅샷을 처음 로드하는 동안에는 저장소를 직접 세지 않고 마지막 집계를 사용
+    if storage and not get_feed_snapshot().loaded(versions):
+        fallback = last_good.peek('post_stats')
+        if fallback is not None:
+            return fallback
+    try:
+        post_stats = _load_post_stats_cached(*versions)
+    except Exception as e:
+        fallback = last_good.get('post_stats')
+        if fallback is not None:
+            return fallback
+        st.error(f"통계 로드 중 오류가 발생했습니다: {e}")
+        return count_post_stats([])
+    last_good.put('post_stats', post_stats)
+    return post_stats
+
+@st.cache_data(ttl=5)  # 테이블 버전이 바뀌면 새로 집계
+def _load_post_stats_cached(post_version, reply_version):
+    perf_monitor.cache_miss('post_stats')
+    if not storage:
+        return count_post_stats([])
+    
+    # 공유 스냅샷이 만들어져 있으면 메모리에서 집계 (추가 DB 조회 없음, 아니면 백그라운드 로드 시작)
+    # (오류는 캐시되지 않도록 그대로 전달)
+    post_stats = get_feed_snapshot().stats((post_version, reply_version))
+    if post_stats is not None:
+        return post_stats
+    
+    # 전체/구분별/답변 완료 개수를 동시에 조회
+    total, answered, *category_counts = run_concurrently(
+        storage.count_posts,
+        storage.count_answered_questions,
+        *(partial(storage.count_posts, category) for category in POST_CATEGORIES),
+    )
+    categories = {category: count for category, count in zip(POST_CATEGORIES, category_counts) if count}
+    questions = categories.get('질문', 0)
+    return {'total': total, 'categories': categories, 'answered': answered, 'waiting': questions - answered}
+
+# 답변 대기 질문 로드 함수
+def load_answer_inbox(limit=INBOX_SIZE):
+    """답변 대기 질문 수, 가장 오래 기다린 (질문, 작성 시각) 목록, 첫 답변까지 걸린 시간(p50/p95)을 반환합니다."""
+    if not storage:
+        return build_local_inbox(get_local_feed().get()[1], limit)
+    
+    try:
+        return get_feed_snapshot().inbox((table_versions.get('post'), table_versions.get('reply')), limit)
+    except Exception as e:
+        st.error(f"답변 대기 목록 로드 중 오류가 발생했습니다: {e}")
+        return build_local_inbox([], limit)
+
+# 로컬 저장 (fallback) 게시물의 답변 대기 요약 함수
+def build_local_inbox(posts, limit=INBOX_SIZE):
+    """로컬 게시물로 임시 색인을 만들어 답변 대기 요약을 반환합니다."""
+    questions = QuestionIndex()
+    by_id = {}
+    for post in posts:
+        if post.type != "질문":
+            continue
+        by_id[post.id] = post
+        first_reply_ts = min((reply.created_ts for reply in post.replies), default=None)
+        questions.update(post.id, post.created_ts, first_reply_ts)
+    summary = questions.summary(limit)
+    summary['posts'] = [(by_id[post_id], created_ts) for created_ts, post_id in summary.pop('oldest')]
+    return summary
+
+# 게시물 검색 함수
+def search_posts(query, limit=SEARCH_RESULT_LIMIT):
+    """공유 스냅샷의 검색 색인에서 게시물을 찾습니다. (추가 DB 조회 없음)"""
+    if not storage:
         return []
+    
+    try:
+        return get_feed_snapshot().search(query, (table_versions.get('post'), table_versions.get('reply')), limit)
+    except Exception as e:
+        st.error(f"검색 중 오류가 발생했습니다: {e}")
+        return []
+
+# 커뮤니티 피드 한 페이지에 표시할 게시물 수
+FEED_PAGE_SIZE = 20
+# 관리자 게시물 관리 탭 한 페이지에 표시할 게시물 수
+ADMIN_PAGE_SIZE = 50
+# 일괄 답변 완료 처리 시 기본 답변
+BULK_REPLY_TEXT = "확인했습니다. 추가 문의는 '문의하기'를 이용해주세요."
+
+# 게시물 페이지 로드 함수 (키셋 페이지네이션)
+def load_post_page(cursor=None, limit=FEED_PAGE_SIZE):
+    """(created_at, id) 커서 이전의 게시물을 최신순으로 최대 limit개 로드합니다.
+    
+    (게시물 목록, 다음 페이지 커서)를 반환하며, 마지막 페이지이면 커서는 None입니다.
+    조회에 실패하면 같은 페이지를 마지막으로 성공했을 때의 결과를 반환합니다.
+    """
+    perf_monitor.cache_lookup('post_page')
+    last_good = get_last_good_results()
+    versions = (table_versions.get('post'), table_versions.get('reply'))
+    # 공유 스냅샷을 처음 로드하는 동안에는 저장소를 직접 조회하지 않고 마지막으로 받은 페이지를 표시
+    if storage and not get_feed_snapshot().loaded(versions):
+        fallback = last_good.peek(('post_page', cursor, limit))
+        if fallback is not None:
+            return fallback
+    try:
+        page = _load_post_page_cached(cursor, limit, *versions)
+    except Exception as e:
+        fallback = last_good.get(('post_page', cursor, limit))
+        if fallback is not None:
+            return fallback
+        st.error(f"데이터 로드 중 오류가 발생했습니다: {e}")
+        return [], None
+    last_good.put(('post_page', cursor, limit), page)
+    return page
+
+@st.cache_data(ttl=5, max_entries=256)  # 페이지(커서)별로 별도 캐시, 테이블 버전이 바뀌면 새로 로드
+def _load_post_page_cached(cursor, limit, post_version, reply_version):
+    perf_monitor.cache_miss('post_page')
+    if not storage:
+        return [], None
+    
+    # 공유 스냅샷이 만들어져 있으면 메모리에서 페이지를 자름 (추가 DB 조회 없음, 아니면 백그라운드 로드 시작)
+    # (오류는 캐시되지 않도록 그대로 전달)
+    page = get_feed_snapshot().page(cursor, limit, (post_version, reply_version))
+    if page is not None:
+        return page
+    
+    # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+    page_rows = storage.fetch_post_page(cursor, limit + 1)
+    
+    rows = page_rows[:limit]
+    replies_by_post = fetch_replies_by_post([post['id'] for post in rows])
+    posts = [build_post(post, replies_by_post.get(post['id'], [])) for post in rows]
+    
+    next_cursor = None
+    if len(page_rows) > limit:
+        next_cursor = (rows[-1]['created_at'], rows[-1]['id'])
+    return posts, next_cursor
+
+# 쓰기 대기열 설정
+WRITE_BATCH_SIZE = 50  # 한 번에 저장할 최대 행 수
+WRITE_MAX_ATTEMPTS = 5
+WRITE_RETRY_BASE = 0.5  # 첫 재시도 대기 시간 (초, 재시도마다 2배)
+WRITE_RETRY_MAX = 8  # 최대 재시도 대기 시간 (초)
+# 저장 대기 중인 글이 있을 때 상태를 확인하는 주기 (초)
+WRITE_STATUS_POLL_INTERVAL = 1
+
+# 쓰기 대기열에 들어간 행
+class PendingWrite:
+    """저장을 기다리는 행 하나입니다. status는 'pending'에서 'confirmed' 또는 'failed'로 바뀝니다."""
+
+    def __init__(self, table, data):
+        self.table = table
+        self.data = data
+        self.status = 'pending'
+        self.row = None  # 저장 후 저장소가 반환한 행
+        self.error = None
+        self.attempts = 0
+        self.solo = False  # 배치 저장에 실패한 행은 단독으로 재시도 (문제 행 격리)
+
+# 프로세스 전체가 공유하는 쓰기 대기열
+class WriteQueue:
+    """게시물/답글 저장을 백그라운드 스레드에서 처리합니다.
+    
+    제출은 즉시 PendingWrite를 반환하고, 작업 스레드는 대기 중인 행을 테이블별로 모아
+    한 번의 요청으로 저장합니다. 저장 중에 들어온 제출은 다음 배치로 묶이므로
+    제출이 몰려도 처리량이 요청 지연 시간에 묶이지 않습니다.
+    실패한 행은 지수 백오프로 재시도하고, 끝내 실패하면 'failed'로 표시합니다.
+    
+    재시도 전에는 클라이언트가 정한 작성 시각과 내용(write_key)으로 이미 저장된 행을 찾으므로,
+    저장된 뒤 응답만 실패한 경우(시간 초과 등)에도 같은 행을 두 번 저장하지 않습니다.
+    """
+
+    def __init__(self, snapshot):
+        self._snapshot = snapshot  # 저장 결과를 반영할 공유 스냅샷
+        self._cond = threading.Condition(threading.RLock())
+        self._queue = []  # (재시도 시각, 순번, PendingWrite) 힙
+        self._seq = 0
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+
+    def submit(self, table, data):
+        return self.submit_many(table, [data])[0]
+
+    def submit_many(self, table, rows):
+        """여러 행을 한꺼번에 넣습니다. 같은 배치로 묶여 한 번의 요청으로 저장됩니다."""
+        entries = [PendingWrite(table, data) for data in rows]
+        with self._cond:
+            for entry in entries:
+                self._push(entry, 0.0)
+        return entries
+
+    def _push(self, entry, ready_at):
+        with self._cond:
+            self._seq += 1
+            heapq.heappush(self._queue, (ready_at, self._seq, entry))
+            self._cond.notify()
+
+    def _take_batches(self):
+        with self._cond:
+            while not self._queue or self._queue[0][0] > time.monotonic():
+                self._cond.wait(self._queue[0][0] - time.monotonic() if self._queue else None)
+            ready = []
+            while self._queue and self._queue[0][0] <= time.monotonic() and len(ready) < WRITE_BATCH_SIZE:
+                ready.append(heapq.heappop(self._queue)[2])
+        
+        batches = []
+        by_table = {}
+        for entry in ready:
+            if entry.solo:
+                batches.append([entry])
+            else:
+                by_table.setdefault(entry.table, []).append(entry)
+        return batches + list(by_table.values())
+
+    def _run(self):
+        while True:
+            for batch in self._take_batches():
+                try:
+                    self._write(batch)
+                except Exception as e:
+                    # 예상하지 못한 오류로 하나뿐인 작업 스레드가 멈추지 않도록 해당 배치만 실패 처리
+                    for entry in batch:
+                        if entry.status == 'pending':
+                            entry.error = str(e)
+                            entry.status = 'failed'
+
+    @staticmethod
+    def _write_key(table, row):
+        """저장할 행과 저장소가 반환한 행을 짝짓는 키입니다. (작성 시각은 클라이언트가 정하므로 행마다 고유)"""
+        created_ts = parse_timestamp(row['created_at']).timestamp()
+        if table == 'post':
+            return (row['name'], row['text'], created_ts)
+        return (row['id'], row['reply'], created_ts)
+
+    def _find_saved(self, table, batch):
+        # 이전 시도에서 실제로는 저장된 행 조회 (작성 시각 이후의 행만 조회하므로 요청이 작음)
+        if table == 'post':
+            since = min((entry.data['created_at'] for entry in batch), key=parse_timestamp)
+            return storage.fetch_posts(since=since)
+        return storage.fetch_replies(list({entry.data['id'] for entry in batch}))
+
+    def _write(self, batch):
+        table = batch[0].table
+        insert = storage.insert_posts if table == 'post' else storage.insert_replies
+        try:
+            saved = {}
+            if any(entry.attempts for entry in batch):
+                keys = {self._write_key(table, entry.data) for entry in batch}
+                saved = {
+                    key: row for row in self._find_saved(table, batch)
+                    if (key := self._write_key(table, row)) in keys
+                }
+            unsaved = [entry for entry in batch if self._write_key(table, entry.data) not in saved]
+            rows = insert([entry.data for entry in unsaved]) if unsaved else []
+        except Exception as e:
+            for entry in batch:
+                entry.attempts += 1
+                if entry.attempts >= WRITE_MAX_ATTEMPTS:
+                    entry.error = str(e)
+                    entry.status = 'failed'
+                    continue
+                entry.solo = entry.solo or len(batch) > 1
+                delay = min(WRITE_RETRY_BASE * 2 ** (entry.attempts - 1), WRITE_RETRY_MAX)
+                self._push(entry, time.monotonic() + delay)
+            return
+        
+        # 반환된 행은 순서나 개수가 요청과 다를 수 있으므로 (RLS, return=minimal 등) 키로 짝지음
+        for row in rows:
+            saved[self._write_key(table, row)] = row
+        try:
+            # 상태를 확인한 세션이 다시 로드할 때 새 행이 보이도록 스냅샷에 먼저 반영 (버전도 올라감)
+            if saved:
+                if table == 'post':
+                    self._snapshot.add_posts(list(saved.values()))
+                else:
+                    self._snapshot.add_replies(list(saved.values()))
+        finally:
+            for entry in batch:
+                entry.row = saved.get(self._write_key(table, entry.data))
+                if entry.row is None:
+                    entry.error = "저장 결과를 확인할 수 없습니다."
+                    entry.status = 'failed'
+                else:
+                    entry.status = 'confirmed'
 
-# Supabase에 게시물 저장 함수
+@st.cache_resource
+def get_write_queue():
+    return WriteQueue(get_feed_snapshot())
+
+# 게시물 저장 함수
 def save_post_to_supabase(name, category, text):
-    """Supabase에 새 게시물을 저장합니다."""
-    if not supabase:
+    """새 게시물을 쓰기 대기열에 넣고, 저장 상태를 담은 PendingWrite를 반환합니다."""
+    if not storage:
         return False
     
     try:
@@ -69,23 +1855,37 @@ def save_post_to_supabase(name, category, text):
             'name': name,
             'category': category,  # type -> category로 매핑
             'text': text,
-            'created_at': datetime.now().isoformat()
+            'created_at': datetime.now(timezone.utc).isoformat()
         }
         
-        response = supabase.table('post').insert(data).execute()
-        return True
+        return get_write_queue().submit('post', data)
     except Exception as e:
         st.error(f"게시물 저장 중 오류가 발생했습니다: {e}")
         return False
 
-# Supabase에서 게시물 삭제 함수
+# 게시물 삭제 함수
 def delete_post_from_supabase(post_id):
-    """Supabase에서 게시물을 삭제합니다."""
-    if not supabase:
+    """저장소에서 게시물을 삭제합니다."""
+    if not storage:
+        return False
+    
+    try:
+        storage.delete_posts([post_id])
+        get_feed_snapshot().remove_posts([post_id])
+        return True
+    except Exception as e:
+        st.error(f"게시물 삭제 중 오류가 발생했습니다: {e}")
+        return False
+
+# 게시물 일괄 삭제 함수
+def delete_posts_from_supabase(post_ids):
+    """저장소에서 여러 게시물을 한 번의 요청으로 삭제합니다."""
+    if not storage or not post_ids:
         return False
     
     try:
-        response = supabase.table('post').delete().eq('id', post_id).execute()
+        storage.delete_posts(post_ids)
+        get_feed_snapshot().remove_posts(post_ids)
         return True
     except Exception as e:
         st.error(f"게시물 삭제 중 오류가 발생했습니다: {e}")
@@ -93,335 +1893,433 @@ def delete_post_from_supabase(post_id):
 
 # 시간 차이 계산 함수
 def get_time_ago(created_at):
-    """시간 차이를 계산하여 '?분전', '?시간전', '?일전' 형식으로 반환합니다."""
+    """시간 차이를 계산하여 '?분전', '?시간전', '?일전' 형식으로 반환합니다. (경과 분 단위로 캐시)"""
     try:
-        # ISO 형식의 시간을 datetime 객체로 변환
+        # ISO 형식 문자열, datetime, epoch 시각 모두 허용
         if isinstance(created_at, str):
-            created_time = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-        else:
-            created_time = created_at
-        
-        now = datetime.now(created_time.tzinfo) if created_time.tzinfo else datetime.now()
-        diff = now - created_time
-        
-        if diff.days > 0:
-            return f"{diff.days}일전"
-        elif diff.seconds >= 3600:
-            hours = diff.seconds // 3600
-            return f"{hours}시간전"
-        elif diff.seconds >= 60:
-            minutes = diff.seconds // 60
-            return f"{minutes}분전"
-        else:
-            return "방금전"
+            created_at = parse_timestamp(created_at)
+        if isinstance(created_at, datetime):
+            created_at = created_at.timestamp()
+        return format_time_ago(created_at)
     except Exception as e:
         return "시간 정보 없음"
 
-# Supabase에서 답글 로드 함수
-def load_replies_from_supabase(post_id):
-    """특정 게시물의 답글들을 Supabase에서 로드합니다."""
-    if not supabase:
-        return []
-    
-    try:
-        response = supabase.table('reply').select('reply, created_at').eq('id', post_id).order('created_at', desc=False).execute()
-        
-        replies = []
-        for reply_data in response.data:
-            replies.append({
-                'text': reply_data['reply'],
-                'time': datetime.fromisoformat(reply_data['created_at'].replace('Z', '+00:00')).strftime('%Y-%m-%d %H:%M')
-            })
-        return replies
-    except Exception as e:
-        st.error(f"답글 로드 중 오류가 발생했습니다: {e}")
-        return []
-
-# Supabase에 답글 저장 함수
+# 경과 시간 표시 함수
+def format_duration(seconds):
+    """초 단위 시간을 '?일 ?시간', '?시간 ?분', '?분' 형식으로 반환합니다."""
+    minutes = int(seconds // 60)
+    days, minutes = divmod(minutes, 24 * 60)
+    hours, minutes = divmod(minutes, 60)
+    if days:
+        return f"{days}일 {hours}시간"
+    if hours:
+        return f"{hours}시간 {minutes}분"
+    if minutes:
+        return f"{minutes}분"
+    return "1분 미만"
+
+# 여러 게시물의 답글을 일괄 로드하는 함수
+def fetch_replies_by_post(post_ids):
+    """여러 게시물의 답글을 한 번에 로드하여 {게시물 ID: 답글 목록} 형태로 반환합니다. (오류는 호출한 쪽에 전달)"""
+    replies_by_post = {}
+    if post_ids:
+        for reply_data in storage.fetch_replies(post_ids):
+            replies_by_post.setdefault(reply_data['id'], []).append(build_reply(reply_data))
+    return replies_by_post
+
+# 답글 저장 함수
 def save_reply_to_supabase(post_id, reply_text):
-    """Supabase에 새 답글을 저장합니다."""
-    if not supabase:
+    """새 답글을 쓰기 대기열에 넣고, 저장 상태를 담은 PendingWrite를 반환합니다."""
+    if not storage:
         return False
     
     try:
         data = {
             'id': post_id,  # 외래키로 post id 참조
             'reply': reply_text,
-            'created_at': datetime.now().isoformat()
+            'created_at': datetime.now(timezone.utc).isoformat()
         }
         
-        response = supabase.table('reply').insert(data).execute()
-        return True
+        return get_write_queue().submit('reply', data)
     except Exception as e:
         st.error(f"답글 저장 중 오류가 발생했습니다: {e}")
         return False
 
-# CSS 스타일
-st.markdown(
-    """
-<style>
-    .main-header {
-        text-align: center;
-        padding: 2rem;
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border-radius: 10px;
-        margin-bottom: 2rem;
-    }
-    .info-card {
-        background-color: #f0f2f6;
-        padding: 1.5rem;
-        border-radius: 10px;
-        margin-bottom: 1rem;
-        border-left: 5px solid #667eea;
-    }
-    .prize-card {
-        background-color: #fff;
-        padding: 1rem;
-        border-radius: 8px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        margin-bottom: 0.5rem;
-        border: 2px solid #f0f2f6;
-    }
-    .deadline-alert {
-        background-color: #ff6b6b;
-        color: white;
-        padding: 1rem;
-        border-radius: 5px;
-        text-align: center;
-        font-weight: bold;
-    }
-    .success-box {
-        background-color: #51cf66;
-        color: white;
-        padding: 1rem;
-        border-radius: 5px;
-        text-align: center;
-    }
-    
-    /* 사이드바 스타일링 */
-    .sidebar .sidebar-content {
-        background: linear-gradient(180deg, #f8f9fa 0%, #e9ecef 100%);
-    }
+# 답글 일괄 저장 함수
+def save_replies_to_supabase(post_ids, reply_text):
+    """여러 게시물에 같은 답글을 쓰기 대기열에 한꺼번에 넣습니다. (한 번의 요청으로 저장)"""
+    if not storage or not post_ids:
+        return []
     
+    try:
+        created_at = datetime.now(timezone.utc).isoformat()
+        return get_write_queue().submit_many(
+            'reply', [{'id': post_id, 'reply': reply_text, 'created_at': created_at} for post_id in post_ids]
+        )
+    except Exception as e:
+        st.error(f"답글 저장 중 오류가 발생했습니다: {e}")
+        return []
 
+# 공지사항/차단 목록 재조회 주기 (초, 다른 서버 프로세스에서의 변경 반영용)
+MODERATION_SYNC_INTERVAL = 30
+# 로드에 실패한 뒤 다시 시도하기까지 기다리는 시간 (초, 그동안은 마지막으로 성공한 값을 사용)
+MODERATION_RETRY_INTERVAL = 5
+
+# 프로세스 전체가 공유하는 테이블 캐시 값
+class SharedValue:
+    """테이블 버전이 바뀌었거나 재조회 주기가 지났을 때만 다시 로드하는 값입니다.
     
-    /* 라디오 버튼 스타일링 */
-    .stRadio > div[role="radiogroup"] > label {
-        background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
-        padding: 12px 16px;
-        margin: 5px 0;
-        border-radius: 10px;
-        border: 2px solid transparent;
-        cursor: pointer;
-        transition: all 0.3s ease;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        display: block !important;
-        width: 100%;
-    }
-    
-    .stRadio > div[role="radiogroup"] > label:hover {
-        transform: translateY(-1px);
-        box-shadow: 0 4px 8px rgba(0,0,0,0.15);
-        background: linear-gradient(135deg, #e9ecef 0%, #dee2e6 100%);
-    }
-    
-    .stRadio > div[role="radiogroup"] > label:has(input:checked) {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
-        color: white !important;
-        border-color: #667eea;
-        box-shadow: 0 4px 12px rgba(102, 126, 234, 0.3);
-    }
-    
-    /* 라디오 버튼 원형 아이콘 숨기기 (더 안전한 방법) */
-    .stRadio > div[role="radiogroup"] > label > div:first-child {
-        width: 0px !important;
-        height: 0px !important;
-        min-width: 0px !important;
-        margin-right: 0px !important;
-        visibility: hidden !important;
-    }
-    
-    /* 사이드바 제목 스타일 */
-    .sidebar-title {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        font-weight: bold;
-        font-size: 1.2em;
-        margin-bottom: 1rem;
-    }
-    
-    /* 통계 카드 스타일 */
-    .stats-container {
-        display: flex;
-        gap: 15px;
-        margin: 20px 0;
-        flex-wrap: wrap;
-    }
-    
-    .stat-card {
-        flex: 1;
-        min-width: 150px;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 20px;
-        border-radius: 15px;
-        text-align: center;
-        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
-        transition: all 0.3s ease;
-    }
-    
-    .stat-card:hover {
-        transform: translateY(-3px);
-        box-shadow: 0 8px 25px rgba(102, 126, 234, 0.4);
-    }
-    
-    .stat-number {
-        font-size: 2em;
-        font-weight: bold;
-        margin-bottom: 5px;
-    }
-    
-    .stat-label {
-        font-size: 0.9em;
-        opacity: 0.9;
-    }
-    
-    /* 게시물 카드 스타일 */
-    .post-card {
-        background: white;
-        border-radius: 15px;
-        padding: 20px;
-        margin: 15px 0;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-        border: 1px solid #f0f2f6;
-        transition: all 0.3s ease;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .post-card:hover {
-        transform: translateY(-3px);
-        box-shadow: 0 8px 25px rgba(0,0,0,0.15);
-    }
-    
-    .post-header {
-        display: flex;
-        justify-content: space-between;
-        align-items: flex-start;
-        margin-bottom: 15px;
-        padding-bottom: 10px;
-        border-bottom: 2px solid #f8f9fa;
-        min-height: 40px;
-    }
-    
-    .post-author {
-        font-weight: bold;
-        color: #2c3e50;
-        font-size: 1.1em;
+    모든 세션이 같은 객체를 공유하므로 반환값을 수정하지 않아야 합니다.
+    """
+
+    def __init__(self, table, loader, interval, empty):
+        self._table = table
+        self._loader = loader
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._value = empty  # 한 번도 로드되지 않았을 때 반환할 값
+        self._version = None
+        self._loaded_at = None
+        self._failed_at = None  # 마지막 로드 실패 시각 (monotonic, 성공하면 None)
+        self._fresh_since = time.time()  # 값이 최신이었던 마지막 시각 (epoch, 갱신 지연 표시용)
+        self.last_error = None  # 마지막 로드 실패 메시지 (성공하면 None)
+
+    def get(self):
+        """필요하면 다시 로드한 뒤 값을 반환합니다.
+        
+        로드에 성공했을 때만 재조회 시각과 버전을 기록합니다. 실패하면 오류를 last_error에 기록하고
+        마지막으로 성공한 값(없으면 빈 값)을 반환하며, MODERATION_RETRY_INTERVAL초가 지나야 다시 시도합니다.
+        """
+        version = table_versions.get(self._table)
+        with self._lock:
+            now = time.monotonic()
+            expired = self._loaded_at is None or now - self._loaded_at >= self._interval
+            retry_wait = self._failed_at is not None and now - self._failed_at < MODERATION_RETRY_INTERVAL
+            if (expired or version != self._version) and not retry_wait:
+                try:
+                    self._value = self._loader()
+                except Exception as e:
+                    self._failed_at = now
+                    self.last_error = str(e)
+                else:
+                    self._loaded_at = now
+                    self._version = version
+                    self._failed_at = None
+                    self._fresh_since = time.time()
+                    self.last_error = None
+            return self._value
+
+    def staleness(self):
+        """로드가 실패하고 있으면 마지막으로 최신이었던 뒤 지난 시간(초)을, 아니면 None을 반환합니다."""
+        if self.last_error is None:
+            return None
+        return time.time() - self._fresh_since
+
+def _fetch_notices():
+    return tuple(
+        {
+            'id': notice['id'],
+            'type': notice['type'],
+            'content': notice['content'],
+            'time': format_time(parse_timestamp(notice['created_at']).timestamp()),
+        }
+        for notice in storage.fetch_notices()
+    )
+
+def _fetch_blocked_users():
+    # 사용자 이름 -> 차단일 (이름으로 O(1) 조회)
+    return {
+        user['name']: format_date(parse_timestamp(user['created_at']).timestamp())
+        for user in storage.fetch_blocked_users()
     }
-    
-    .post-time {
-        color: #6c757d;
-        font-size: 0.9em;
-        margin-top: 2px;
+
+@st.cache_resource
+def get_moderation_cache():
+    return {
+        'notice': SharedValue('notice', _fetch_notices, MODERATION_SYNC_INTERVAL, ()),
+        'blocked_user': SharedValue('blocked_user', _fetch_blocked_users, MODERATION_SYNC_INTERVAL, {}),
     }
+
+# 공지사항 로드 함수
+def load_notices():
+    """공지사항 목록을 반환합니다. (프로세스 공유 캐시)"""
+    if not storage:
+        return ()
     
-    .post-header-right {
-        display: flex;
-        flex-direction: column;
-        align-items: flex-end;
-        gap: 8px;
-    }
+    # 로드에 실패하면 마지막으로 성공한 목록을 반환 (지연은 '데이터 갱신 지연' 배지로 표시)
+    return get_moderation_cache()['notice'].get()
+
+# 공지사항 저장 함수
+def save_notice(notice_type, content):
+    """저장소에 새 공지사항을 저장합니다."""
+    if not storage:
+        return False
     
-    .post-category {
-        display: inline-block;
-        padding: 4px 12px;
-        border-radius: 20px;
-        font-size: 0.8em;
-        font-weight: 500;
-        margin-bottom: 10px;
-    }
+    try:
+        storage.insert_notice({
+            'type': notice_type,
+            'content': content,
+            'created_at': datetime.now(timezone.utc).isoformat()
+        })
+        table_versions.bump('notice')
+        return True
+    except Exception as e:
+        st.error(f"공지사항 저장 중 오류가 발생했습니다: {e}")
+        return False
+
+# 공지사항 삭제 함수
+def delete_notice(notice_id):
+    """저장소에서 공지사항을 삭제합니다."""
+    if not storage:
+        return False
     
-    .category-question {
-        background: linear-gradient(135deg, #ff6b6b, #ffa726);
-        color: white;
-    }
+    try:
+        storage.delete_notice(notice_id)
+        table_versions.bump('notice')
+        return True
+    except Exception as e:
+        st.error(f"공지사항 삭제 중 오류가 발생했습니다: {e}")
+        return False
+
+# 차단 사용자 로드 함수
+def load_blocked_users():
+    """{사용자 이름: 차단일} 형태의 차단 목록을 반환합니다. (프로세스 공유 캐시)"""
+    if not storage:
+        return {}
     
-    .category-info {
-        background: linear-gradient(135deg, #4ecdc4, #44a08d);
-        color: white;
-    }
+    # 로드에 실패하면 마지막으로 성공한 목록을 반환 (지연은 '데이터 갱신 지연' 배지로 표시)
+    return get_moderation_cache()['blocked_user'].get()
+
+# 사용자 차단 함수
+def block_user(name):
+    """사용자를 차단 목록에 추가합니다."""
+    return block_users([name])
+
+# 사용자 일괄 차단 함수
+def block_users(names):
+    """여러 사용자를 한 번의 요청으로 차단 목록에 추가합니다."""
+    if not storage or not names:
+        return False
     
-    .category-idea {
-        background: linear-gradient(135deg, #a8edea, #fed6e3);
-        color: #2c3e50;
-    }
+    try:
+        created_at = datetime.now(timezone.utc).isoformat()
+        storage.insert_blocked_users([{'name': name, 'created_at': created_at} for name in names])
+        table_versions.bump('blocked_user')
+        return True
+    except Exception as e:
+        st.error(f"사용자 차단 중 오류가 발생했습니다: {e}")
+        return False
+
+# 사용자 차단 해제 함수
+def unblock_user(name):
+    """사용자를 차단 목록에서 제거합니다."""
+    if not storage:
+        return False
     
-    .category-other {
-        background: linear-gradient(135deg, #d299c2, #fef9d7);
-        color: #2c3e50;
-    }
+    try:
+        storage.delete_blocked_user(name)
+        table_versions.bump('blocked_user')
+        return True
+    except Exception as e:
+        st.error(f"차단 해제 중 오류가 발생했습니다: {e}")
+        return False
+
+# 답변 상태 표시 이름
+STATUS_LABELS = {"answered": "답변완료", "waiting": "답변대기"}
+
+# 카테고리별 CSS 클래스
+CATEGORY_CLASSES = {
+    "질문": "category-question",
+    "정보공유": "category-info",
+    "아이디어": "category-idea",
+    "기타": "category-other",
+}
+
+# 피드를 표시할 때 한 번의 st.markdown으로 보낼 게시물 수
+FEED_RENDER_CHUNK_SIZE = 50
+
+# 게시물 카드 HTML 생성 함수
+def render_post_html(post, search_terms=()):
+    """게시물 카드와 관리자 답변을 하나의 HTML 조각으로 만듭니다."""
+    category_class = CATEGORY_CLASSES.get(post.type, "category-other")
     
-    .post-content {
-        color: #2c3e50;
-        line-height: 1.6;
-        font-size: 1em;
-        margin: 15px 0;
-    }
+    # 상태 스타일 설정
+    status_html = ""
+    if post.status == "pending":
+        status_html = '<div class="post-status status-pending">저장 중</div>'
+    elif post.type == "질문":
+        if post.status == "answered":
+            status_html = '<div class="post-status status-answered">답변완료</div>'
+        else:
+            status_html = '<div class="post-status status-waiting">답변대기</div>'
     
-    .post-status {
-        padding: 5px 10px;
-        border-radius: 15px;
-        font-size: 0.8em;
-        font-weight: bold;
-        white-space: nowrap;
-    }
+    # 게시물 내용도 HTML 안전하게 처리 (마크다운 코드 블록으로 해석되지 않도록 들여쓰기/빈 줄 없이 작성)
+    safe_name = highlight_html(post.name, search_terms)
+    safe_time = html.escape(f"{post.time} · {post.time_ago}")
+    safe_type = html.escape(post.type)
+    safe_text = highlight_html(post.text, search_terms).replace("\n", "<br>")
+    parts = [
+        '<div class="post-card">',
+        '<div class="post-header">',
+        f'<div><div class="post-author">{safe_name}</div><div class="post-time">{safe_time}</div></div>',
+        f'<div class="post-header-right">{status_html}</div>',
+        '</div>',
+        f'<div class="post-category {category_class}">{safe_type}</div>',
+        f'<div class="post-content">{safe_text}</div>',
+        '</div>',
+    ]
     
-    .status-waiting {
-        background: #ffeaa7;
-        color: #e17055;
-    }
+    # 관리자 답변 (화살표 아이콘과 들여쓰기, 답글도 검색 대상이므로 검색어 강조)
+    for reply in post.replies:
+        safe_reply = highlight_html(reply.text, search_terms).replace("\n", "<br>")
+        parts.append(
+            '<div class="reply-thread"><div class="reply-arrow">↳</div>'
+            f'<div class="admin-reply"><strong>👨‍💼 관리자 답변</strong><br><br>{safe_reply}'
+            f'<div class="reply-time">{html.escape(reply.time)}</div></div></div>'
+        )
+    return "\n".join(parts)
+
+# 렌더링된 게시물 카드 HTML 캐시 크기
+RENDER_CACHE_SIZE = 2000
+
+# 게시물 카드 HTML 캐시 (모든 세션 공유)
+class RenderCache:
+    """게시물 카드 HTML을 (게시물 id, 내용 해시, 답글 수) 키로 보관하는 LRU 캐시입니다.
     
-    .status-answered {
-        background: #00b894;
-        color: white;
-    }
+    내용이 수정되거나 답글이 달리면 키가 달라지므로 별도의 무효화가 필요 없고,
+    이전 키의 항목은 LRU 순서에 따라 밀려납니다.
+    """
+
+    def __init__(self, max_size):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._items = OrderedDict()
+
+    @staticmethod
+    def _key(post):
+        # 상대 시각('?분전')도 포함하므로 카드는 표시가 바뀌는 분 단위로만 다시 렌더링됨
+        content_hash = hash((post.name, post.type, post.text, post.time, post.time_ago, post.status))
+        return (post.id, content_hash, len(post.replies))
+
+    def get_or_render(self, post):
+        key = self._key(post)
+        with self._lock:
+            post_html = self._items.get(key)
+            if post_html is not None:
+                self._items.move_to_end(key)
+        perf_monitor.cache_lookup('render_card', hit=post_html is not None)
+        if post_html is not None:
+            return post_html
+        
+        post_html = render_post_html(post)
+        with self._lock:
+            self._items[key] = post_html
+            if len(self._items) > self._max_size:
+                self._items.popitem(last=False)
+        return post_html
+
+@st.cache_resource
+def get_render_cache():
+    return RenderCache(RENDER_CACHE_SIZE)
+
+# 게시물 피드 표시 함수
+def render_feed(posts, search_terms=()):
+    """게시물 목록을 FEED_RENDER_CHUNK_SIZE개씩 묶어 한 번의 st.markdown으로 전송합니다."""
+    # 검색어 강조가 없는 카드는 공유 캐시에서 재사용
+    if search_terms:
+        render = lambda post: render_post_html(post, search_terms)
+    else:
+        render = get_render_cache().get_or_render
     
-    .admin-reply {
-        background: linear-gradient(135deg, #667eea, #764ba2);
-        color: white;
-        padding: 15px;
-        border-radius: 10px;
-        margin-top: 15px;
-        border-left: 4px solid #4834d4;
-        position: relative;
-    }
+    started = time.perf_counter()
+    sent = 0
+    for start in range(0, len(posts), FEED_RENDER_CHUNK_SIZE):
+        chunk = posts[start:start + FEED_RENDER_CHUNK_SIZE]
+        chunk_html = "\n".join(render(post) for post in chunk)
+        sent += len(chunk_html)
+        st.markdown(chunk_html, unsafe_allow_html=True)
+    perf_monitor.record('render', 'feed', time.perf_counter() - started, sent)
+
+# fragment 재실행 함수
+def rerun_fragment():
+    """fragment 안에서 호출되면 해당 fragment만, 그 외에는 앱 전체를 다시 실행합니다."""
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        # 전체 실행 중 호출된 경우 (fragment 단독 재실행이 아님)
+        st.rerun()
+
+# fragment 단독 재실행 소요 시간 측정 데코레이터 (@st.fragment 아래에 사용)
+def timed_fragment(func):
+    """fragment 단독 재실행의 소요 시간을 ('rerun', 함수 이름)으로 기록합니다.
     
-    .admin-reply::before {
-        content: "👨‍💼";
-        position: absolute;
-        top: -5px;
-        left: 15px;
-        background: white;
-        padding: 5px;
-        border-radius: 50%;
-        font-size: 1.2em;
-    }
+    전체 실행 중의 fragment 실행은 전체 실행 시간에 포함되므로 따로 기록하지 않고,
+    st.rerun()/st.stop()으로 중단된 실행도 전체 실행과 같이 제외합니다.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        ctx = get_script_run_ctx()
+        if ctx is None or not ctx.fragment_ids_this_run:
+            return func(*args, **kwargs)
+        started = time.perf_counter()
+        result = func(*args, **kwargs)
+        perf_monitor.record('rerun', func.__name__, time.perf_counter() - started)
+        return result
     
-    .reply-time {
-        font-size: 0.8em;
-        opacity: 0.8;
-        margin-top: 10px;
-    }
+    return wrapper
+
+# 관리자 답변 작성 영역 표시 함수
+def admin_reply_box(comment, key_prefix=""):
+    """'답변 작성' 버튼을 표시하고, 작성 중인 게시물에만 답변 입력란과 등록 버튼을 만듭니다."""
+    editing_key = (key_prefix, comment.id)
+    if st.session_state.get("admin_editing") != editing_key:
+        if st.button("💬 답변 작성", key=f"{key_prefix}reply_open_{comment.id}"):
+            st.session_state.admin_editing = editing_key
+            rerun_fragment()
+        return
+
+    reply_text = st.text_area("답변", key=f"{key_prefix}reply_{comment.id}")
+    if st.button("취소", key=f"{key_prefix}reply_cancel_{comment.id}"):
+        st.session_state.admin_editing = None
+        rerun_fragment()
+    if st.button("답변 등록", key=f"{key_prefix}reply_btn_{comment.id}"):
+        if reply_text:
+            st.session_state.admin_editing = None
+            # 저장소에 답글 저장 시도
+            if storage:
+                entry = save_reply_to_supabase(comment.id, reply_text)
+                if entry:
+                    # 저장이 끝날 때까지 '저장 중'으로 표시
+                    st.session_state.pending_writes.append(entry)
+                    st.success("✅ 답변이 등록되었습니다!")
+                    # 저장 결과 확인 영역이 표시되도록 전체 실행
+                    st.rerun()
+                else:
+                    st.error("답변 저장 중 오류가 발생했습니다.")
+            else:
+                # 로컬 저장 (fallback)
+                add_local_replies([comment.id], reply_text)
+                st.session_state.feed_version = None  # 답글이 추가된 최신 목록 표시
+                st.success("답변이 등록되었습니다!")
+                rerun_fragment()
+
+# CSS 스타일 (static/style.css를 프로세스당 한 번만 읽음)
+STYLESHEET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "style.css")
+
+@st.cache_resource
+def load_stylesheet(path):
+    """스타일시트 파일을 읽어 내용 해시가 붙은 <style> 블록을 만듭니다.
     
+    내용이 같으면 매 실행 동일한 메시지가 되므로, Streamlit 메시지 캐시
+    (.streamlit/config.toml의 minCachedMessageSize)에 의해 브라우저가 이미 받은
+    스타일시트는 다시 전송되지 않고 해시 참조만 전송됩니다.
+    """
+    with open(path, encoding="utf-8") as f:
+        css = f.read()
+    digest = hashlib.sha256(css.encode()).hexdigest()[:12]
+    return f'<style data-version="{digest}">\n{css}</style>'
 
-</style>
-""",
-    unsafe_allow_html=True,
-)
+st.markdown(load_stylesheet(STYLESHEET_PATH), unsafe_allow_html=True)
 
 # 헤더
 st.markdown(
@@ -479,17 +2377,9 @@ with st.sidebar:
     if days_left > 0:
         st.markdown(
             f"""
-            <div style="
-                background: linear-gradient(135deg, #ff6b6b 0%, #ffa726 100%);
-                color: white;
-                padding: 15px;
-                border-radius: 10px;
-                text-align: center;
-                margin: 10px 0;
-                box-shadow: 0 3px 10px rgba(255, 107, 107, 0.3);
-            ">
+            <div class="sidebar-countdown">
                 ⏰ <strong>마감까지</strong><br>
-                <span style="font-size: 1.5em; font-weight: bold;">{days_left}일</span>
+                <span class="sidebar-countdown-days">{days_left}일</span>
             </div>
             """,
             unsafe_allow_html=True,
@@ -497,14 +2387,7 @@ with st.sidebar:
     else:
         st.markdown(
             """
-            <div style="
-                background: #6c757d;
-                color: white;
-                padding: 15px;
-                border-radius: 10px;
-                text-align: center;
-                margin: 10px 0;
-            ">
+            <div class="sidebar-countdown closed">
                 ⏰ <strong>접수 마감</strong>
             </div>
             """,
@@ -792,194 +2675,392 @@ elif menu == "💬 커뮤니티":
     if "show_admin_login" not in st.session_state:
         st.session_state.show_admin_login = False
 
-    # 관리자 로그인 버튼 (우측 상단)
-    col1, col2 = st.columns([5, 1])
-    with col2:
-        if not st.session_state.is_admin:
-            if st.button("🔐 관리자", use_container_width=True, key="admin_login_btn"):
-                st.session_state.show_admin_login = (
-                    not st.session_state.show_admin_login
-                )
-        else:
-            st.success("관리자")
-            if st.button("로그아웃", use_container_width=True, key="admin_logout_btn"):
-                st.session_state.is_admin = False
-                st.session_state.show_admin_login = False
-                st.rerun()
-
-    # 관리자 로그인 폼
-    if st.session_state.show_admin_login and not st.session_state.is_admin:
-        with st.container():
-            st.markdown("---")
-            with st.form("admin_login"):
-                st.markdown("#### 🔐 관리자 로그인")
-                password = st.text_input("비밀번호", type="password")
-                col1, col2 = st.columns(2)
-                with col1:
-                    if st.form_submit_button("로그인", use_container_width=True):
-                        # 환경변수에서 관리자 비밀번호 불러오기
-                        admin_password = st.secrets.get("ADMIN_PASSWORD", "")
-                        if admin_password and (
-                            hashlib.sha256(password.encode()).hexdigest()
-                            == hashlib.sha256(admin_password.encode()).hexdigest()
-                        ):
-                            st.session_state.is_admin = True
+    # 게시물 목록은 모든 세션이 공유하며, 세션에는 관리자 화면이 보고 있는 목록의 버전만 저장
+    # (전체 실행 시 최신 버전으로 이동하고, 탭 안의 조작 중에는 같은 목록을 유지)
+    st.session_state.feed_version = None
+    # 저장 대기 중인 내 게시물/답변 (쓰기 대기열 항목)
+    if "pending_writes" not in st.session_state:
+        st.session_state.pending_writes = []
+    # 관리자 일괄 처리 횟수 (처리 후 표의 선택 상태 초기화용)
+    if "admin_bulk_round" not in st.session_state:
+        st.session_state.admin_bulk_round = 0
+
+    # 아래 영역들은 fragment로 분리되어 있어, 영역 안의 위젯을 조작하면
+    # 앱 전체가 아니라 해당 영역만 다시 실행되고 전송됩니다.
+
+    # 관리자 로그인 버튼 (우측 상단) 및 로그인 폼
+    @st.fragment
+    @timed_fragment
+    def admin_login_panel():
+        col1, col2 = st.columns([5, 1])
+        with col2:
+            if not st.session_state.is_admin:
+                if st.button("🔐 관리자", use_container_width=True, key="admin_login_btn"):
+                    st.session_state.show_admin_login = (
+                        not st.session_state.show_admin_login
+                    )
+            else:
+                st.success("관리자")
+                if st.button("로그아웃", use_container_width=True, key="admin_logout_btn"):
+                    st.session_state.is_admin = False
+                    st.session_state.show_admin_login = False
+                    st.rerun()
+
+        # 관리자 로그인 폼
+        if st.session_state.show_admin_login and not st.session_state.is_admin:
+            with st.container():
+                st.markdown("---")
+                with st.form("admin_login"):
+                    st.markdown("#### 🔐 관리자 로그인")
+                    password = st.text_input("비밀번호", type="password")
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        if st.form_submit_button("로그인", use_container_width=True):
+                            # 환경변수에서 관리자 비밀번호 불러오기
+                            admin_password = st.secrets.get("ADMIN_PASSWORD", "")
+                            if admin_password and (
+                                hashlib.sha256(password.encode()).hexdigest()
+                                == hashlib.sha256(admin_password.encode()).hexdigest()
+                            ):
+                                st.session_state.is_admin = True
+                                st.session_state.show_admin_login = False
+                                st.success("관리자로 로그인되었습니다!")
+                                st.rerun()
+                            else:
+                                st.error("비밀번호가 틀렸습니다.")
+                    with col2:
+                        if st.form_submit_button("취소", use_container_width=True):
                             st.session_state.show_admin_login = False
-                            st.success("관리자로 로그인되었습니다!")
-                            st.rerun()
-                        else:
-                            st.error("비밀번호가 틀렸습니다.")
-                with col2:
-                    if st.form_submit_button("취소", use_container_width=True):
-                        st.session_state.show_admin_login = False
-                        st.rerun()
-            st.markdown("---")
-
-    # 데이터 초기화
-    if "comments" not in st.session_state:
-        st.session_state.comments = []
-    if "notices" not in st.session_state:
-        st.session_state.notices = []
-    if "blocked_users" not in st.session_state:
-        st.session_state.blocked_users = []
+                            rerun_fragment()
+                st.markdown("---")
+
+    admin_login_panel()
+
+    # 저장 대기 중인 글 표시 및 저장 결과 확인 (대기 중인 글이 있을 때만 호출되어 주기적으로 실행)
+    @st.fragment(run_every=WRITE_STATUS_POLL_INTERVAL)
+    @timed_fragment
+    def write_status_panel():
+        entries = st.session_state.pending_writes
+
+        # 저장이 확인된 글은 피드와 통계에 반영되도록 전체 실행
+        if any(entry.status == "confirmed" for entry in entries):
+            st.session_state.pending_writes = [
+                entry for entry in entries if entry.status != "confirmed"
+            ]
+            st.rerun()
+
+        # 끝내 저장하지 못한 글은 내용과 함께 알림 (임시 표시에서 제거)
+        failed = [entry for entry in entries if entry.status == "failed"]
+        for entry in failed:
+            if entry.table == "post":
+                st.error(f"게시물 저장에 실패했습니다: {entry.error}\n\n{entry.data['text']}")
+            else:
+                st.error(f"답변 저장에 실패했습니다: {entry.error}\n\n{entry.data['reply']}")
+        if failed and st.button("확인", key="dismiss_failed_writes"):
+            st.session_state.pending_writes = [
+                entry for entry in entries if entry.status != "failed"
+            ]
+            st.rerun()
+
+        # 저장 중인 게시물은 피드 맨 위에 임시로 표시
+        pending_posts = [
+            build_pending_post(entry.data)
+            for entry in reversed(entries)
+            if entry.table == "post" and entry.status == "pending"
+        ]
+        if pending_posts:
+            st.markdown(
+                "\n".join(render_post_html(post) for post in pending_posts),
+                unsafe_allow_html=True,
+            )
 
     # 관리자 모드
     if st.session_state.is_admin:
         st.info("🔐 관리자 모드로 접속 중입니다.")
 
-        # 관리자 모드에서도 Supabase 데이터 로드
-        if supabase:
-            posts_data = load_posts_from_supabase()
-            if posts_data:
-                st.session_state.comments = posts_data
+        if st.session_state.pending_writes:
+            write_status_panel()
 
-        admin_menu = st.tabs(
-            ["📝 게시물 관리", "📢 공지사항", "🚫 차단 관리", "📊 통계"]
-        )
+        # 탭 이름은 고정 (이름이 바뀌면 Streamlit이 첫 번째 탭으로 되돌리므로 대기 수는 탭 안에 표시)
+        admin_menu = st.tabs(["📝 게시물 관리", "📥 답변 대기", "📢 공지사항", "🚫 차단 관리", "📊 통계"])
 
-        with admin_menu[0]:  # 게시물 관리
+        @st.fragment
+        @timed_fragment
+        def admin_posts_tab():
             st.markdown("#### 📝 게시물 관리")
 
-            if st.session_state.comments:
-                for i, comment in enumerate(st.session_state.comments):
+            # 공유 게시물 목록 로드 (보고 있던 버전이 있으면 그 버전 유지)
+            version, all_posts = load_posts_from_supabase(st.session_state.feed_version)
+            st.session_state.feed_version = version
+            blocked_users = load_blocked_users()
+            render_stale_badge()
+
+            # 다른 사용자가 목록을 바꾼 경우 최신 목록으로 이동 (선택 상태는 초기화)
+            latest_version = get_feed_snapshot().versions.latest if storage else get_local_feed().latest
+            if latest_version != version:
+                col1, col2 = st.columns([4, 1])
+                with col1:
+                    st.caption("새 게시물이나 변경 사항이 있습니다.")
+                with col2:
+                    if st.button("🔄 새로고침", key="admin_feed_refresh", use_container_width=True):
+                        st.session_state.feed_version = None
+                        rerun_fragment()
+
+            # 저장 중인 답변 (게시물 ID -> 답변 내용 목록)
+            pending_replies = {}
+            for entry in st.session_state.pending_writes:
+                if entry.table == "reply" and entry.status == "pending":
+                    pending_replies.setdefault(entry.data["id"], []).append(entry.data["reply"])
+
+            # 필터 (바꾸면 첫 페이지로 이동)
+            def reset_admin_page():
+                st.session_state.admin_page = 1
+
+            col1, col2, col3 = st.columns([1, 1, 2])
+            with col1:
+                only_waiting = st.checkbox(
+                    "미답변 질문만", key="admin_filter_waiting", on_change=reset_admin_page
+                )
+            with col2:
+                category = st.selectbox(
+                    "구분", ["전체"] + POST_CATEGORIES, key="admin_filter_category", on_change=reset_admin_page
+                )
+            with col3:
+                author = st.text_input(
+                    "작성자", key="admin_filter_author", placeholder="이름 일부", on_change=reset_admin_page
+                )
+
+            posts = all_posts
+            if only_waiting:
+                posts = [
+                    comment for comment in posts
+                    if comment.type == "질문" and comment.status != "answered"
+                ]
+            if category != "전체":
+                posts = [comment for comment in posts if comment.type == category]
+            if author:
+                author = normalize_text(author)
+                posts = [comment for comment in posts if author in normalize_text(comment.name)]
+
+            # 현재 페이지의 게시물만 표시 (위젯 수를 페이지 크기로 제한)
+            page_count = max((len(posts) - 1) // ADMIN_PAGE_SIZE + 1, 1)
+            # 삭제로 페이지 수가 줄어든 경우 마지막 페이지로 이동
+            if st.session_state.get("admin_page", 1) > page_count:
+                st.session_state.admin_page = page_count
+            page = st.number_input(
+                f"페이지 (전체 {page_count}쪽)", min_value=1, max_value=page_count, key="admin_page"
+            )
+            page_posts = posts[(page - 1) * ADMIN_PAGE_SIZE:page * ADMIN_PAGE_SIZE]
+            if page_posts:
+                start = (page - 1) * ADMIN_PAGE_SIZE
+                st.caption(f"게시물 {len(posts)}개 중 {start + 1}–{start + len(page_posts)}번째")
+
+            # 일괄 관리: 현재 페이지에서 선택한 게시물을 한 번의 요청으로 처리
+            if page_posts:
+                st.markdown("##### ☑️ 일괄 관리")
+                edited_rows = st.data_editor(
+                    [
+                        {
+                            "선택": False,
+                            "ID": comment.id,
+                            "작성자": comment.name,
+                            "구분": comment.type,
+                            "상태": STATUS_LABELS.get(comment.status, ""),
+                            "작성일": comment.time,
+                            "내용": comment.text[:80],
+                        }
+                        for comment in page_posts
+                    ],
+                    # 행 선택은 순서로 저장되므로 목록 버전이 바뀌면 새 표로 시작
+                    key=f"admin_bulk_{version}_{st.session_state.admin_bulk_round}_{page}",
+                    disabled=["ID", "작성자", "구분", "상태", "작성일", "내용"],
+                    hide_index=True,
+                    use_container_width=True,
+                )
+                selected_ids = {row["ID"] for row in edited_rows if row["선택"]}
+                selected = [comment for comment in page_posts if comment.id in selected_ids]
+
+                bulk_reply_text = st.text_input(
+                    "답변 완료 처리 시 등록할 답변", value=BULK_REPLY_TEXT, key="admin_bulk_reply"
+                )
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    if st.button(
+                        f"🗑️ 선택 삭제 ({len(selected)})",
+                        key="admin_bulk_delete",
+                        disabled=not selected,
+                        use_container_width=True,
+                    ):
+                        post_ids = [comment.id for comment in selected]
+                        # 저장소에서 삭제 시도
+                        if storage:
+                            if delete_posts_from_supabase(post_ids):
+                                st.session_state.feed_version = None
+                                st.session_state.admin_bulk_round += 1
+                                rerun_fragment()
+                        else:
+                            # 로컬 삭제 (fallback)
+                            remove_local_posts(post_ids)
+                            st.session_state.feed_version = None
+                            st.session_state.admin_bulk_round += 1
+                            rerun_fragment()
+                with col2:
+                    names = sorted({comment.name for comment in selected} - set(blocked_users))
+                    if st.button(
+                        f"🚫 작성자 차단 ({len(names)})",
+                        key="admin_bulk_block",
+                        disabled=not names,
+                        use_container_width=True,
+                    ):
+                        if block_users(names):
+                            st.session_state.admin_bulk_round += 1
+                            rerun_fragment()
+                with col3:
+                    # 답변이 없는 질문만 대상
+                    targets = [
+                        comment for comment in selected
+                        if comment.type == "질문"
+                        and comment.status != "answered"
+                        and comment.id not in pending_replies
+                    ]
+                    if st.button(
+                        f"✅ 답변 완료 처리 ({len(targets)})",
+                        key="admin_bulk_answer",
+                        disabled=not targets or not bulk_reply_text,
+                        use_container_width=True,
+                    ):
+                        st.session_state.admin_bulk_round += 1
+                        if storage:
+                            entries = save_replies_to_supabase(
+                                [comment.id for comment in targets], bulk_reply_text
+                            )
+                            if entries:
+                                # 저장 결과 확인 영역이 표시되도록 전체 실행
+                                st.session_state.pending_writes.extend(entries)
+                                st.rerun()
+                        else:
+                            # 로컬 저장 (fallback)
+                            add_local_replies([comment.id for comment in targets], bulk_reply_text)
+                            st.session_state.feed_version = None
+                            rerun_fragment()
+                st.divider()
+
+            if page_posts:
+                for comment in page_posts:
                     with st.container():
                         col1, col2 = st.columns([4, 1])
                         with col1:
                             # 질문 상태 표시
                             status_icon = ""
-                            if comment["type"] == "질문":
-                                if comment.get("status") == "answered":
+                            if comment.type == "질문":
+                                if comment.status == "answered":
                                     status_icon = "✅ "
                                 else:
                                     status_icon = "⏳ "
 
                             st.markdown(
-                                f"{status_icon}**{comment['name']}** ({comment['type']}) - {comment['time']}"
+                                f"{status_icon}**{comment.name}** ({comment.type}) - {comment.time}"
                             )
-                            st.write(comment["text"])
+                            st.write(comment.text)
 
                             # 답변 표시
-                            if comment.get("replies"):
-                                for reply in comment["replies"]:
-                                    st.success(f"↳ **관리자 답변**: {reply['text']}")
-                                    st.caption(f"{reply['time']}")
-
-                            # 관리자 답변 작성
+                            if comment.replies:
+                                for reply in comment.replies:
+                                    st.success(f"↳ **관리자 답변**: {reply.text}")
+                                    st.caption(f"{reply.time}")
+                            for reply_text in pending_replies.get(comment.id, []):
+                                st.info(f"↳ **관리자 답변** (저장 중): {reply_text}")
+
+                            # 관리자 답변 작성 (답변 입력란은 작성 중인 게시물에만 생성)
                             if (
-                                comment["type"] == "질문"
-                                and comment.get("status") != "answered"
+                                comment.type == "질문"
+                                and comment.status != "answered"
+                                and comment.id not in pending_replies
                             ):
-                                with st.expander("답변 작성"):
-                                    reply_text = st.text_area(
-                                        "답변", key=f"reply_{comment['id']}"
-                                    )
-                                    if st.button(
-                                        "답변 등록", key=f"reply_btn_{comment['id']}"
-                                    ):
-                                        if reply_text:
-                                            # Supabase에 답글 저장 시도
-                                            if supabase and comment.get("db_id"):
-                                                success = save_reply_to_supabase(comment["db_id"], reply_text)
-                                                if success:
-                                                    # 로컬 상태도 업데이트
-                                                    comment["replies"].append(
-                                                        {
-                                                            "text": reply_text,
-                                                            "time": datetime.now().strftime('%Y-%m-%d %H:%M')
-                                                        }
-                                                    )
-                                                    comment["status"] = "answered"
-                                                    st.success("✅ 답변이 성공적으로 등록되었습니다!")
-                                                    # 캐시 초기화로 새 데이터 반영
-                                                    st.cache_data.clear()
-                                                    st.rerun()
-                                                else:
-                                                    st.error("답변 저장 중 오류가 발생했습니다.")
-                                            else:
-                                                # 로컬 저장 (fallback)
-                                                comment["replies"].append(
-                                                    {
-                                                        "text": reply_text,
-                                                        "time": datetime.now().strftime("%Y-%m-%d %H:%M"),
-                                                    }
-                                                )
-                                                comment["status"] = "answered"
-                                                st.success("답변이 등록되었습니다!")
-                                                st.rerun()
+                                admin_reply_box(comment)
 
                         with col2:
-                            if st.button("🗑️ 삭제", key=f"admin_del_{i}"):
-                                # Supabase에서 삭제 시도
-                                if supabase and comment.get("db_id"):
-                                    success = delete_post_from_supabase(comment["db_id"])
+                            if st.button("🗑️ 삭제", key=f"admin_del_{comment.id}"):
+                                # 저장소에서 삭제 시도
+                                if storage:
+                                    success = delete_post_from_supabase(comment.id)
                                     if success:
-                                        st.session_state.comments.remove(comment)
+                                        st.session_state.feed_version = None
                                         st.success("✅ 게시물이 성공적으로 삭제되었습니다!")
-                                        # 캐시 초기화로 새 데이터 반영
-                                        st.cache_data.clear()
-                                        st.rerun()
+                                        rerun_fragment()
                                     else:
                                         st.error("게시물 삭제 중 오류가 발생했습니다.")
                                 else:
                                     # 로컬 삭제 (fallback)
-                                    st.session_state.comments.remove(comment)
-                                    st.rerun()
-                            if comment["name"] not in [
-                                u["name"] for u in st.session_state.blocked_users
-                            ]:
-                                if st.button("🚫 차단", key=f"block_{i}"):
-                                    st.session_state.blocked_users.append(
-                                        {
-                                            "name": comment["name"],
-                                            "date": datetime.now().strftime("%Y-%m-%d"),
-                                        }
-                                    )
-                                    st.success(f"{comment['name']}님을 차단했습니다.")
+                                    remove_local_posts([comment.id])
+                                    st.session_state.feed_version = None
+                                    rerun_fragment()
+                            if comment.name not in blocked_users:
+                                if st.button("🚫 차단", key=f"block_{comment.id}"):
+                                    if block_user(comment.name):
+                                        st.success(f"{comment.name}님을 차단했습니다.")
                         st.divider()
+            elif all_posts:
+                st.info("조건에 맞는 게시물이 없습니다.")
             else:
                 st.info("아직 게시물이 없습니다.")
 
-        with admin_menu[1]:  # 공지사항
+        @st.fragment
+        @timed_fragment
+        def admin_inbox_tab():
+            st.markdown("#### 📥 답변 대기 질문")
+            inbox = load_answer_inbox()
+
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("답변 대기", inbox["count"])
+            with col2:
+                oldest_wait = (
+                    format_duration(time.time() - inbox["oldest_ts"]) if inbox["oldest_ts"] else "-"
+                )
+                st.metric("가장 오래 기다린 질문", oldest_wait)
+            with col3:
+                st.metric("첫 답변까지 (중앙값)", format_duration(inbox["p50"]) if inbox["p50"] is not None else "-")
+            with col4:
+                st.metric("첫 답변까지 (95%)", format_duration(inbox["p95"]) if inbox["p95"] is not None else "-")
+            st.caption(f"답변된 질문 {inbox['answered']}개 기준")
+
+            if not inbox["posts"]:
+                st.success("답변을 기다리는 질문이 없습니다.")
+
+            # 오래 기다린 질문부터 표시
+            pending_reply_ids = {
+                entry.data["id"] for entry in st.session_state.pending_writes
+                if entry.table == "reply" and entry.status == "pending"
+            }
+            for comment, created_ts in inbox["posts"]:
+                waited = format_duration(time.time() - created_ts)
+                st.markdown(f"⏳ **{comment.name}** - {comment.time} ({waited} 대기)")
+                st.write(comment.text)
+                if comment.id in pending_reply_ids:
+                    st.info("↳ 답변 저장 중입니다.")
+                else:
+                    admin_reply_box(comment, key_prefix="inbox_")
+                st.divider()
+
+        @st.fragment
+        @timed_fragment
+        def admin_notices_tab():
             st.markdown("#### 📢 공지사항 작성")
             with st.form("notice_form"):
                 notice_type = st.selectbox("공지 유형", ["일반", "중요", "긴급"])
                 notice_content = st.text_area("공지 내용")
                 if st.form_submit_button("공지 등록"):
                     if notice_content:
-                        st.session_state.notices.append(
-                            {
-                                "type": notice_type,
-                                "content": notice_content,
-                                "time": datetime.now().strftime("%Y-%m-%d %H:%M"),
-                            }
-                        )
-                        st.success("공지사항이 등록되었습니다!")
-                        st.rerun()
+                        if save_notice(notice_type, notice_content):
+                            st.success("공지사항이 등록되었습니다!")
+                            rerun_fragment()
 
             # 공지사항 목록
-            if st.session_state.notices:
+            notices = load_notices()
+            if notices:
                 st.markdown("#### 등록된 공지사항")
-                for notice in st.session_state.notices:
+                for notice in notices:
                     col1, col2 = st.columns([4, 1])
                     with col1:
                         if notice["type"] == "긴급":
@@ -990,53 +3071,165 @@ elif menu == "💬 커뮤니티":
                             st.info(f"[{notice['type']}] {notice['content']}")
                         st.caption(notice["time"])
                     with col2:
-                        if st.button("삭제", key=f"del_notice_{notice['time']}"):
-                            st.session_state.notices.remove(notice)
-                            st.rerun()
+                        if st.button("삭제", key=f"del_notice_{notice['id']}"):
+                            if delete_notice(notice["id"]):
+                                rerun_fragment()
 
-        with admin_menu[2]:  # 차단 관리
+        @st.fragment
+        @timed_fragment
+        def admin_blocks_tab():
             st.markdown("#### 🚫 차단된 사용자")
-            if st.session_state.blocked_users:
-                for user in st.session_state.blocked_users:
+            blocked_users = load_blocked_users()
+            if blocked_users:
+                for name, date in blocked_users.items():
                     col1, col2 = st.columns([3, 1])
                     with col1:
-                        st.write(f"**{user['name']}** - 차단일: {user['date']}")
+                        st.write(f"**{name}** - 차단일: {date}")
                     with col2:
-                        if st.button("차단 해제", key=f"unblock_{user['name']}"):
-                            st.session_state.blocked_users.remove(user)
-                            st.rerun()
+                        if st.button("차단 해제", key=f"unblock_{name}"):
+                            if unblock_user(name):
+                                rerun_fragment()
                     st.divider()
             else:
                 st.info("차단된 사용자가 없습니다.")
 
-        with admin_menu[3]:  # 통계
+        @st.fragment
+        @timed_fragment
+        def admin_stats_tab():
             st.markdown("#### 📊 커뮤니티 통계")
 
+            post_stats = load_post_stats() if storage else count_post_stats(load_posts_from_supabase()[1])
+
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("전체 게시물", len(st.session_state.comments))
+                st.metric("전체 게시물", post_stats["total"])
             with col2:
-                st.metric("차단된 사용자", len(st.session_state.blocked_users))
+                st.metric("차단된 사용자", len(load_blocked_users()))
             with col3:
-                st.metric("공지사항", len(st.session_state.notices))
+                st.metric("공지사항", len(load_notices()))
+
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("답변 완료 질문", post_stats["answered"])
+            with col2:
+                st.metric("답변 대기 질문", post_stats["waiting"])
 
             # 게시물 유형별 통계
-            if st.session_state.comments:
+            if post_stats["categories"]:
                 st.markdown("##### 게시물 유형별 현황")
-                type_counts = {}
-                for comment in st.session_state.comments:
-                    type_counts[comment["type"]] = (
-                        type_counts.get(comment["type"], 0) + 1
+                for type_name, count in post_stats["categories"].items():
+                    st.write(f"- {type_name}: {count}개")
+
+            # 성능 (서버 프로세스 전체, 소요 시간은 최근 측정값 기준)
+            st.markdown("##### ⚡ 성능")
+            perf = perf_monitor.summary()
+            timings = {(row["kind"], row["name"]): row for row in perf["timings"]}
+
+            def format_ms(seconds):
+                return f"{seconds * 1000:,.0f}ms" if seconds is not None else "-"
+
+            reruns = perf["kinds"].get("rerun", {})
+            storage_calls = perf["kinds"].get("storage", {})
+            snapshot_cache = perf["cache"].get("feed_snapshot")
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("재실행 (중앙값)", format_ms(reruns.get("p50")))
+            with col2:
+                st.metric("재실행 (95%)", format_ms(reruns.get("p95")))
+            with col3:
+                st.metric("저장소 호출 (95%)", format_ms(storage_calls.get("p95")))
+            with col4:
+                st.metric(
+                    "게시물 스냅샷 적중률",
+                    f"{snapshot_cache['hit_ratio']:.0%}" if snapshot_cache and snapshot_cache["hit_ratio"] is not None else "-",
+                )
+            st.caption(
+                f"서버 시작 후 {format_duration(time.time() - perf_monitor.started_at)} · "
+                f"최근 측정값 {perf['samples']}건 기준"
+            )
+            if storage:
+                snapshot = get_feed_snapshot()
+                snapshot_age = snapshot.staleness()
+                if snapshot_age is not None:
+                    st.caption(
+                        f"게시물 스냅샷: {format_duration(snapshot_age)} 전 갱신"
+                        + (f" · 마지막 갱신 실패: {snapshot.last_error}" if snapshot.last_error else "")
                     )
 
-                for type_name, count in type_counts.items():
-                    st.write(f"- {type_name}: {count}개")
+            if timings:
+                st.markdown("###### 항목별 소요 시간")
+                st.dataframe(
+                    [
+                        {
+                            "구분": PERF_KIND_LABELS.get(row["kind"], row["kind"]),
+                            "항목": row["name"],
+                            "누적 호출": row["calls"],
+                            "오류": row["errors"],
+                            "p50": format_ms(row["p50"]),
+                            "p95": format_ms(row["p95"]),
+                            "p99": format_ms(row["p99"]),
+                            "최대": format_ms(row["max"]),
+                            "평균 크기": f"{row['avg_size']:,.0f}" if row["avg_size"] is not None else "-",
+                        }
+                        for row in timings.values()
+                    ],
+                    hide_index=True,
+                    use_container_width=True,
+                )
+                st.caption("크기: 저장소 호출은 반환 행 수, 렌더링은 전송한 HTML 글자 수, 로드는 게시물 수")
+
+            # 테이블별 저장소 호출 수 (누적)
+            table_calls = {}
+            for (kind, name), row in timings.items():
+                if kind == "storage":
+                    table = name.split(".", 1)[0]
+                    table_calls[table] = table_calls.get(table, 0) + row["calls"]
+            if table_calls:
+                st.markdown("###### 테이블별 저장소 호출")
+                for table, count in sorted(table_calls.items(), key=lambda item: -item[1]):
+                    st.write(f"- {table}: {count:,}회")
+
+            if perf["cache"]:
+                st.markdown("###### 캐시 적중률")
+                for name, cache in perf["cache"].items():
+                    ratio = f"{cache['hit_ratio']:.0%}" if cache["hit_ratio"] is not None else "-"
+                    st.write(f"- {PERF_CACHE_LABELS.get(name, name)}: {ratio} (조회 {cache['lookups']:,}회, 실패 {cache['misses']:,}회)")
+
+            st.markdown(f"###### 느린 호출 ({PERF_SLOW_THRESHOLD * 1000:.0f}ms 이상, 최근)")
+            if perf["slow"]:
+                for kind, name, seconds, size, recorded_at in perf["slow"]:
+                    size_text = f", 크기 {size:,}" if size is not None else ""
+                    st.write(
+                        f"- {format_ms(seconds)} · {PERF_KIND_LABELS.get(kind, kind)} {name}{size_text} "
+                        f"({get_time_ago(recorded_at)})"
+                    )
+            else:
+                st.caption("느린 호출이 없습니다.")
+
+            if st.button("🔄 새로고침", key="perf_refresh"):
+                rerun_fragment()
+
+        with admin_menu[0]:  # 게시물 관리
+            admin_posts_tab()
+
+        with admin_menu[1]:  # 답변 대기
+            admin_inbox_tab()
+
+        with admin_menu[2]:  # 공지사항
+            admin_notices_tab()
+
+        with admin_menu[3]:  # 차단 관리
+            admin_blocks_tab()
+
+        with admin_menu[4]:  # 통계
+            admin_stats_tab()
 
     # 일반 사용자 모드
     else:
         # 공지사항 표시
-        if st.session_state.notices:
-            for notice in st.session_state.notices:
+        notices = load_notices()
+        if notices:
+            for notice in notices:
                 if notice["type"] == "긴급":
                     st.error(f"📢 [{notice['type']}] {notice['content']}")
                 elif notice["type"] == "중요":
@@ -1046,78 +3239,65 @@ elif menu == "💬 커뮤니티":
 
         st.info("공모전 관련 질문, 아이디어 공유, 네트워킹을 위한 공간입니다.")
 
-        # Supabase 연결 상태 확인
-        if not supabase:
+        # 저장소 연결 상태 확인
+        if not storage:
             st.warning("⚠️ 데이터베이스 연결을 확인해주세요. Supabase 설정이 필요합니다.")
             st.info("현재는 로컬 저장 방식으로 작동합니다.")
 
         # 댓글 작성 폼
-        with st.form("community_form", clear_on_submit=True):
-            col1, col2 = st.columns([3, 1])
-            with col1:
-                comment_name = st.text_input("이름 또는 닉네임")
-            with col2:
-                comment_type = st.selectbox(
-                    "구분", ["질문", "정보공유", "아이디어", "기타"]
-                )
+        @st.fragment
+        @timed_fragment
+        def community_form():
+            with st.form("community_form", clear_on_submit=True):
+                col1, col2 = st.columns([3, 1])
+                with col1:
+                    comment_name = st.text_input("이름 또는 닉네임")
+                with col2:
+                    comment_type = st.selectbox(
+                        "구분", POST_CATEGORIES
+                    )
 
-            comment_text = st.text_area("내용을 입력하세요", height=100)
+                comment_text = st.text_area("내용을 입력하세요", height=100)
 
-            if st.form_submit_button("✏️ 작성하기", use_container_width=True):
-                if comment_name and comment_text:
-                    # 차단된 사용자 확인
-                    if comment_name in [
-                        u["name"] for u in st.session_state.blocked_users
-                    ]:
-                        st.error("차단된 사용자입니다. 관리자에게 문의하세요.")
-                    else:
-                        # Supabase에 저장 시도
-                        if supabase:
-                            success = save_post_to_supabase(comment_name, comment_type, comment_text)
-                            if success:
-                                st.success("✅ 게시물이 성공적으로 등록되었습니다!")
+                if st.form_submit_button("✏️ 작성하기", use_container_width=True):
+                    if comment_name and comment_text:
+                        # 차단된 사용자 확인
+                        if comment_name in load_blocked_users():
+                            st.error("차단된 사용자입니다. 관리자에게 문의하세요.")
+                        else:
+                            # 저장소에 저장 시도
+                            if storage:
+                                entry = save_post_to_supabase(comment_name, comment_type, comment_text)
+                                if entry:
+                                    # 저장이 끝날 때까지 피드 맨 위에 '저장 중'으로 표시
+                                    st.session_state.pending_writes.append(entry)
+                                    st.success("✅ 게시물이 등록되었습니다!")
+                                    st.balloons()
+                                    # 저장 결과 확인 영역이 표시되도록 전체 실행
+                                    st.rerun()
+                                else:
+                                    st.error("게시물 저장 중 오류가 발생했습니다.")
+                            else:
+                                # 로컬 저장 (fallback)
+                                add_local_post(comment_name, comment_type, comment_text)
+                                st.success("✅ 작성되었습니다!")
                                 st.balloons()
-                                # 캐시 초기화로 새 데이터 반영
-                                st.cache_data.clear()
                                 st.rerun()
-                            else:
-                                st.error("게시물 저장 중 오류가 발생했습니다.")
-                        else:
-                            # 로컬 저장 (fallback)
-                            st.session_state.comments.append(
-                                {
-                                    "id": len(st.session_state.comments) + 1,
-                                    "name": comment_name,
-                                    "type": comment_type,
-                                    "text": comment_text,
-                                    "time": datetime.now().strftime("%Y-%m-%d %H:%M"),
-                                    "replies": [],  # 답변 저장용
-                                    "status": (
-                                        "waiting" if comment_type == "질문" else "none"
-                                    ),
-                                }
-                            )
-                            st.success("✅ 작성되었습니다!")
-                            st.balloons()
-                else:
-                    st.error("이름과 내용을 모두 입력해주세요.")
-
-        # 게시물 데이터 로드 (Supabase 또는 로컬)
-        if supabase:
-            # Supabase에서 데이터 로드
-            posts_data = load_posts_from_supabase()
-            if posts_data:
-                st.session_state.comments = posts_data
-        
-        # 댓글 통계
-        questions = len([c for c in st.session_state.comments if c["type"] == "질문"])
-        info_posts = len([c for c in st.session_state.comments if c["type"] == "정보공유"])
-        ideas = len([c for c in st.session_state.comments if c["type"] == "아이디어"])
+                    else:
+                        st.error("이름과 내용을 모두 입력해주세요.")
+
+        community_form()
+
+        # 댓글 통계 (저장소 집계 또는 로컬)
+        post_stats = load_post_stats() if storage else count_post_stats(load_posts_from_supabase()[1])
+        questions = post_stats["categories"].get("질문", 0)
+        info_posts = post_stats["categories"].get("정보공유", 0)
+        ideas = post_stats["categories"].get("아이디어", 0)
         
         stats_html = f"""
         <div class="stats-container">
             <div class="stat-card">
-                <div class="stat-number">{len(st.session_state.comments)}</div>
+                <div class="stat-number">{post_stats["total"]}</div>
                 <div class="stat-label">📝 전체 글</div>
             </div>
             <div class="stat-card">
@@ -1135,118 +3315,90 @@ elif menu == "💬 커뮤니티":
 
         st.divider()
 
-        # 댓글 표시
-        if st.session_state.comments:
-            # 최신 글부터 표시
-            displayed_comments = list(reversed(st.session_state.comments)) if not supabase else st.session_state.comments
-            
-            for i, comment in enumerate(displayed_comments):
-                # 카테고리 스타일 설정
-                category_class = {
-                    "질문": "category-question",
-                    "정보공유": "category-info", 
-                    "아이디어": "category-idea",
-                    "기타": "category-other"
-                }.get(comment["type"], "category-other")
-                
-                # 상태 스타일 설정
-                status_html = ""
-                if comment["type"] == "질문":
-                    if comment.get("status") == "answered":
-                        status_html = '<div class="post-status status-answered">답변완료</div>'
-                    else:
-                        status_html = '<div class="post-status status-waiting">답변대기</div>'
-                
-                                # 게시물 내용도 HTML 안전하게 처리
-                safe_name = html.escape(comment['name'])
-                safe_time = html.escape(comment['time'])
-                safe_type = html.escape(comment['type'])
-                safe_text = html.escape(comment['text']).replace('\n', '<br>')
-                
-                # 게시물 카드 HTML (답글 제외)
-                post_html = f"""
-                <div class="post-card">
-                    <div class="post-header">
-                        <div>
-                            <div class="post-author">{safe_name}</div>
-                            <div class="post-time">{safe_time}</div>
-                        </div>
-                        <div class="post-header-right">
-                            {status_html}
+        if st.session_state.pending_writes:
+            write_status_panel()
+
+        # 게시물 검색 및 목록
+        @st.fragment
+        @timed_fragment
+        def community_feed():
+            # 표시할 페이지 수 초기화 ("더 보기"를 누를 때마다 1페이지씩 추가)
+            if "feed_pages" not in st.session_state:
+                st.session_state.feed_pages = 1
+
+            # 게시물 검색
+            search_query = st.text_input(
+                "🔍 게시물 검색", key="feed_search", placeholder="작성자, 내용, 답변에서 검색"
+            )
+            search_terms = normalize_text(search_query).split()
+
+            # 표시할 게시물 로드 (검색 결과 또는 페이지 단위)
+            has_more = False
+            if search_terms:
+                if storage:
+                    displayed_comments = search_posts(search_query)
+                else:
+                    # 로컬 저장 (fallback): 로컬 게시물로 임시 색인 생성
+                    local_index = SearchIndex()
+                    local_posts = {comment.id: comment for comment in load_posts_from_supabase()[1]}
+                    for comment in local_posts.values():
+                        local_index.add(comment.id, post_search_text(comment), comment.created_ts)
+                    displayed_comments = [local_posts[post_id] for post_id in local_index.search(search_query)]
+                st.caption(f"검색 결과 {len(displayed_comments)}건")
+            elif storage:
+                displayed_comments = []
+                cursor = None
+                for _ in range(st.session_state.feed_pages):
+                    page_posts, cursor = load_post_page(cursor)
+                    displayed_comments.extend(page_posts)
+                    if cursor is None:
+                        break
+                has_more = cursor is not None
+            else:
+                # 로컬 저장 (fallback): 최신 글부터 페이지 단위로 표시
+                visible_count = st.session_state.feed_pages * FEED_PAGE_SIZE
+                _, local_posts = load_posts_from_supabase()
+                displayed_comments = local_posts[:visible_count]
+                has_more = len(local_posts) > visible_count
+
+            # 저장소 오류로 이전 데이터를 표시 중이면 알림
+            render_stale_badge()
+
+            # 댓글 표시
+            if displayed_comments:
+                # 게시물 카드와 답글을 묶음 단위 HTML로 표시 (게시물마다 개별 전송하지 않음)
+                render_feed(displayed_comments, search_terms)
+
+                # 다음 페이지 불러오기
+                if has_more:
+                    # 콜백에서 페이지 수를 늘려 추가 rerun 없이 다음 실행에 반영
+                    def show_more_posts():
+                        st.session_state.feed_pages += 1
+
+                    st.button(
+                        "더 보기",
+                        use_container_width=True,
+                        key="feed_load_more",
+                        on_click=show_more_posts,
+                    )
+            elif search_terms:
+                st.info("검색 결과가 없습니다.")
+            else:
+                st.markdown(
+                    """
+                    <div class="empty-feed">
+                        <div class="empty-feed-icon">📝</div>
+                        <h3 class="empty-feed-title">아직 작성된 글이 없습니다</h3>
+                        <p class="empty-feed-text">첫 번째 글을 작성하여 커뮤니티를 활성화해보세요!</p>
+                        <div class="empty-feed-action">
+                            <span class="empty-feed-badge">💡 질문, 아이디어, 정보공유 모두 환영합니다!</span>
                         </div>
                     </div>
-                    <div class="post-category {category_class}">
-                        {safe_type}
-                    </div>
-                    <div class="post-content">
-                        {safe_text}
-                    </div>
-                </div>
-                """
-                
-                # 게시물 카드 표시
-                st.markdown(post_html, unsafe_allow_html=True)
-                
-                # 관리자 답변을 Streamlit 컴포넌트로 표시 (화살표 아이콘과 들여쓰기)
-                if comment.get("replies"):
-                    for reply in comment["replies"]:
-                        with st.container():
-                            st.markdown(
-                                f"""
-                                <div style="display: flex; align-items: flex-start; margin: 10px 0;">
-                                    <div style="
-                                        color: #667eea;
-                                        font-size: 1.5em;
-                                        margin-right: 10px;
-                                        margin-top: 5px;
-                                        font-weight: bold;
-                                    ">
-                                        ↳
-                                    </div>
-                                    <div style="
-                                        background: linear-gradient(135deg, #667eea, #764ba2);
-                                        color: white;
-                                        padding: 15px;
-                                        border-radius: 10px;
-                                        border-left: 4px solid #4834d4;
-                                        flex: 1;
-                                    ">
-                                        <strong>👨‍💼 관리자 답변</strong><br><br>
-                                        {reply['text']}<br>
-                                        <small style="opacity: 0.8;">{reply['time']}</small>
-                                    </div>
-                                </div>
-                                """,
-                                unsafe_allow_html=True
-                            )
-        else:
-            st.markdown(
-                """
-                <div style="
-                    text-align: center; 
-                    padding: 60px 40px; 
-                    background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
-                    border-radius: 20px;
-                    margin: 30px 0;
-                    border: 2px dashed #dee2e6;
-                ">
-                    <div style="font-size: 3em; margin-bottom: 20px;">📝</div>
-                    <h3 style="color: #495057; margin-bottom: 15px;">아직 작성된 글이 없습니다</h3>
-                    <p style="color: #6c757d; font-size: 1.1em;">첫 번째 글을 작성하여 커뮤니티를 활성화해보세요!</p>
-                    <div style="margin-top: 20px;">
-                        <span style="
-                            background: linear-gradient(135deg, #667eea, #764ba2);
-                            color: white;
-                            padding: 8px 20px;
-                            border-radius: 25px;
-                            font-size: 0.9em;
-                            display: inline-block;
-                        ">💡 질문, 아이디어, 정보공유 모두 환영합니다!</span>
-                    </div>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
+                    """,
+                    unsafe_allow_html=True,
+                )
+
+        community_feed()
 
 
 
@@ -1268,9 +3420,16 @@ elif menu == "📧 문의하기":
 st.markdown("---")
 st.markdown(
     """
-<div style="text-align: center; color: gray;">
+<div class="app-footer">
     <p>2025 AI(새)로고침! 우리 교실 앱 공모전 | 경상북도교육청</p>
 </div>
 """,
     unsafe_allow_html=True,
 )
+
+# 전체 실행 소요 시간 기록 (st.rerun()/st.stop()으로 중단된 실행과 fragment 단독 실행은 제외)
+perf_monitor.record('rerun', menu, time.perf_counter() - run_started)
+
+# 실행 프로파일 저장 (fragment 단독 실행은 프로파일링하지 않음)
+if run_profile_format:
+    finish_run_profile(st.session_state.pop("run_profiler"))
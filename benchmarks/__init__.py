@@ -0,0 +1 @@
+"""커뮤니티 성능 측정 도구입니다. (저장소 루트에서 python -m benchmarks.<모듈>로 실행)"""
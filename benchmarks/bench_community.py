@@ -0,0 +1,173 @@
+"""커뮤니티 게시물 로드와 피드 렌더링이 게시판 크기에 따라 얼마나 걸리는지 측정합니다.
+
+    python -m benchmarks.bench_community --sizes 100 1000 10000 100000 --latency 0.05
+
+게시판 크기마다 별도 프로세스에서 합성 게시판을 만들고 AppTest로 app.py를 실행하며,
+단계별 소요 시간 (저장소 대기 시간과 나머지 렌더링 시간), 저장소 호출 수, 최대 메모리를 JSON으로 저장합니다.
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import streamlit
+
+from benchmarks.fake_supabase import FakeSupabaseClient, make_board
+from benchmarks.harness import check, count_cards, find_button, install_client, new_session, open_community
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000]
+RESULTS_DIR = "benchmarks/results"
+FEED_MORE_CLICKS = 3
+SEARCH_QUERY = "개인정보 제출"
+
+
+def peak_rss_mb():
+    """현재 프로세스의 최대 RSS(MB)를 반환합니다. (지원하지 않는 플랫폼이면 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def measure(client, step):
+    """step()을 실행하고 전체 시간, 저장소 대기 시간, 나머지(렌더링) 시간과 호출 수를 반환합니다."""
+    client.reset_stats()
+    started = time.perf_counter()
+    at = step()
+    wall = time.perf_counter() - started
+    load = client.busy_time()
+    return {
+        "wall_s": round(wall, 4),
+        "load_s": round(load, 4),
+        "render_s": round(max(wall - load, 0.0), 4),
+        "calls": sum(client.calls.values()),
+        "calls_by_table": {f"{table}.{op}": count for (table, op), count in sorted(client.calls.items())},
+        "cards": count_cards(at),
+    }
+
+
+def run_board(post_count, latency, jitter, timeout, max_rows):
+    """게시판 하나에 대해 단계별 측정 결과를 반환합니다. (새 프로세스에서 한 번만 호출)"""
+    started = time.perf_counter()
+    tables = make_board(post_count)
+    board_s = time.perf_counter() - started
+    baseline_mb = peak_rss_mb()
+
+    client = FakeSupabaseClient(tables, latency=latency, jitter=jitter, max_rows=max_rows)
+    install_client(client)
+    at = new_session(timeout)
+
+    def click_more():
+        for _ in range(FEED_MORE_CLICKS):
+            button = find_button(at, label="더 보기")
+            if button is None:
+                break
+            check(button.click().run())
+        return at
+
+    def search():
+        at.text_input(key="feed_search").input(SEARCH_QUERY)
+        return check(at.run())
+
+    def clear_search():
+        at.text_input(key="feed_search").input("")
+        return check(at.run())
+
+    def set_admin(value):
+        at.session_state["is_admin"] = value
+        return check(at.run())
+
+    # 순서대로 실행 (첫 방문은 페이지 단위 조회, 관리자 화면이 전체 스냅샷을 처음 만듦)
+    steps = [
+        ("app_start", lambda: check(at.run())),
+        ("community_cold", lambda: open_community(at)),
+        ("feed_more", click_more),
+        ("admin_feed_cold", lambda: set_admin(True)),
+        ("community_warm", lambda: set_admin(False)),
+        ("search", search),
+        ("search_clear", clear_search),
+    ]
+    scenarios = {name: measure(client, step) for name, step in steps}
+
+    peak_mb = peak_rss_mb()
+    return {
+        "posts": len(tables["post"]),
+        "replies": len(tables["reply"]),
+        "board_build_s": round(board_s, 4),
+        "baseline_rss_mb": baseline_mb,
+        "peak_rss_mb": peak_mb,
+        "app_peak_rss_mb": round(peak_mb - baseline_mb, 1) if peak_mb is not None else None,
+        "scenarios": scenarios,
+    }
+
+
+def run_in_subprocess(post_count, args):
+    # 게시판마다 새 프로세스에서 실행해 최대 메모리와 공유 캐시가 서로 섞이지 않도록 함
+    command = [
+        sys.executable, "-m", "benchmarks.bench_community", "--worker", str(post_count),
+        "--latency", str(args.latency), "--jitter", str(args.jitter), "--timeout", str(args.timeout),
+        "--max-rows", str(args.max_rows),
+    ]
+    completed = subprocess.run(command, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"{post_count}개 게시판 측정 실패:\n{completed.stderr[-2000:]}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def print_summary(result):
+    print(f"\n게시물 {result['posts']:,}개 / 답글 {result['replies']:,}개 (최대 메모리 {result['peak_rss_mb']}MB)")
+    for name, scenario in result["scenarios"].items():
+        print(
+            f"  {name:<16} {scenario['wall_s']:>8.3f}s  "
+            f"로드 {scenario['load_s']:>7.3f}s  렌더링 {scenario['render_s']:>7.3f}s  "
+            f"호출 {scenario['calls']:>4}회  카드 {scenario['cards']}개"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="커뮤니티 로드/렌더링 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="게시판 크기 (게시물 수)")
+    parser.add_argument("--latency", type=float, default=0.05, help="저장소 요청별 지연 시간 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="지연 시간에 더할 무작위 값의 최대치 (초)")
+    parser.add_argument("--timeout", type=float, default=600, help="AppTest 실행 한 번의 제한 시간 (초)")
+    parser.add_argument("--max-rows", type=int, default=1000, help="조회 응답 하나의 최대 행 수 (Supabase max-rows, 0이면 제한 없음)")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/community-<시각>.json)")
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        result = run_board(args.worker, args.latency, args.jitter, args.timeout, args.max_rows or None)
+        print(json.dumps(result, ensure_ascii=False))
+        return
+
+    results = []
+    for post_count in args.sizes:
+        result = run_in_subprocess(post_count, args)
+        print_summary(result)
+        results.append(result)
+
+    report = {
+        "benchmark": "community",
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "latency_s": args.latency,
+        "jitter_s": args.jitter,
+        "max_rows": args.max_rows or None,
+        "results": results,
+    }
+    output = args.output or f"{RESULTS_DIR}/community-{datetime.now():%Y%m%d-%H%M%S}.json"
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+    Path(output).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"\n결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+"""메모리에서 동작하는 Supabase 클라이언트 대역과 합성 게시판 생성기입니다.
+
+app.py의 SupabaseStorage가 사용하는 table(...).select/eq/in_/or_/order/limit/insert/upsert/delete
+체인만 흉내 내며, 요청마다 지정한 지연 시간을 더하고 호출 수와 대기 시간을 기록합니다.
+max_rows를 지정하면 실제 Supabase처럼 조회 응답을 그 행 수에서 자릅니다.
+"""
+import random
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+# 테이블별 자동 증가 키 (reply.id는 게시물 ID를 가리키는 외래키)
+AUTO_KEYS = {'post': 'id', 'reply': 'reply_id', 'notice': 'id'}
+# upsert 충돌 판단 키
+UPSERT_KEYS = {'blocked_user': 'name'}
+
+# 필터 연산자 (PostgREST 표기)
+OPERATORS = {
+    'eq': lambda a, b: a == b,
+    'neq': lambda a, b: a != b,
+    'gt': lambda a, b: a > b,
+    'gte': lambda a, b: a >= b,
+    'lt': lambda a, b: a < b,
+    'lte': lambda a, b: a <= b,
+}
+
+
+class FakeResponse:
+    def __init__(self, data, count=None):
+        self.data = data
+        self.count = count
+
+
+class FakeQuery:
+    """요청 하나를 만드는 체인입니다. execute()에서 한 번의 왕복으로 처리됩니다."""
+
+    def __init__(self, client, table):
+        self._client = client
+        self._table = table
+        self._op = 'select'
+        self._columns = '*'
+        self._count = None
+        self._head = False
+        self._payload = None
+        self._filters = []
+        self._orders = []
+        self._limit = None
+
+    # 요청 종류
+    def select(self, columns='*', count=None, head=False):
+        self._columns, self._count, self._head = columns, count, head
+        return self
+
+    def insert(self, data):
+        self._op, self._payload = 'insert', data
+        return self
+
+    def upsert(self, data, **kwargs):
+        self._op, self._payload = 'upsert', data
+        return self
+
+    def update(self, data):
+        self._op, self._payload = 'update', data
+        return self
+
+    def delete(self):
+        self._op = 'delete'
+        return self
+
+    # 필터 및 정렬
+    def _filter(self, op, column, value):
+        self._filters.append(lambda row: OPERATORS[op](row.get(column), value))
+        return self
+
+    def eq(self, column, value):
+        return self._filter('eq', column, value)
+
+    def neq(self, column, value):
+        return self._filter('neq', column, value)
+
+    def gt(self, column, value):
+        return self._filter('gt', column, value)
+
+    def gte(self, column, value):
+        return self._filter('gte', column, value)
+
+    def lt(self, column, value):
+        return self._filter('lt', column, value)
+
+    def lte(self, column, value):
+        return self._filter('lte', column, value)
+
+    def in_(self, column, values):
+        values = set(values)
+        self._filters.append(lambda row: row.get(column) in values)
+        return self
+
+    def or_(self, expression):
+        self._filters.append(parse_or_filter(expression))
+        return self
+
+    def order(self, column, desc=False):
+        self._orders.append((column, desc))
+        return self
+
+    def limit(self, count):
+        self._limit = count
+        return self
+
+    def execute(self):
+        return self._client._execute(self)
+
+
+class FakeSupabaseClient:
+    """테이블을 dict 행 목록으로 보관하는 Supabase 클라이언트 대역입니다.
+
+    latency: 요청마다 더하는 지연 시간 (초), jitter: 지연 시간에 더하는 0~jitter초의 무작위 값
+    tagger: 요청을 보낸 쪽 이름을 반환하는 함수 (지정하면 이름별 호출 수도 기록)
+    max_rows: 조회 응답 하나에 담는 최대 행 수 (Supabase의 max-rows 제한, None이면 제한 없음)
+    """
+
+    def __init__(self, tables=None, latency=0.0, jitter=0.0, seed=0, tagger=None, max_rows=None):
+        self.tables = tables or {}
+        self.latency = latency
+        self.jitter = jitter
+        self.tagger = tagger
+        self.max_rows = max_rows
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._next_ids = {
+            table: max((row[key] for row in self.tables.get(table, [])), default=0) + 1
+            for table, key in AUTO_KEYS.items()
+        }
+        self.reset_stats()
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+    def reset_stats(self):
+        """호출 수와 요청 구간 기록을 초기화합니다."""
+        with self._lock:
+            self.calls = Counter()  # (테이블, 요청 종류) -> 호출 수
+            self.calls_by_tag = {}  # tagger 반환값 -> (테이블, 요청 종류) -> 호출 수
+            self._spans = []  # 요청별 (시작, 끝) 시각
+
+    def busy_time(self):
+        """요청이 하나라도 진행 중이던 시간의 합을 반환합니다. (동시 요청은 겹친 구간을 한 번만 셈)"""
+        with self._lock:
+            spans = sorted(self._spans)
+        total = 0.0
+        end = None
+        for span_start, span_end in spans:
+            if end is None or span_start > end:
+                total += span_end - span_start
+                end = span_end
+            elif span_end > end:
+                total += span_end - end
+                end = span_end
+        return total
+
+    def _execute(self, query):
+        started = time.perf_counter()
+        tag = self.tagger() if self.tagger else None
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+        with self._lock:
+            self.calls[(query._table, query._op)] += 1
+            if self.tagger:
+                self.calls_by_tag.setdefault(tag, Counter())[(query._table, query._op)] += 1
+            response = self._apply(query)
+            self._spans.append((started, time.perf_counter()))
+        return response
+
+    def _apply(self, query):
+        rows = self.tables.setdefault(query._table, [])
+        if query._op in ('insert', 'upsert'):
+            return FakeResponse(self._insert(query._table, rows, query._payload, query._op == 'upsert'))
+
+        matched = [row for row in rows if all(match(row) for match in query._filters)]
+        if query._op == 'delete':
+            deleted = {id(row) for row in matched}
+            rows[:] = [row for row in rows if id(row) not in deleted]
+            if query._table == 'post':
+                # reply.id -> post.id ON DELETE CASCADE
+                post_ids = {row['id'] for row in matched}
+                replies = self.tables.get('reply', [])
+                replies[:] = [row for row in replies if row['id'] not in post_ids]
+            return FakeResponse([dict(row) for row in matched])
+        if query._op == 'update':
+            for row in matched:
+                row.update(query._payload)
+            return FakeResponse([dict(row) for row in matched])
+
+        # reply!inner(...): 답글이 있는 게시물만 포함
+        if 'reply!inner' in query._columns:
+            replied = {row['id'] for row in self.tables.get('reply', [])}
+            matched = [row for row in matched if row['id'] in replied]
+        for column, desc in reversed(query._orders):
+            matched.sort(key=lambda row: row.get(column), reverse=desc)
+        count = len(matched) if query._count else None
+        if query._head:
+            matched = []
+        else:
+            # limit과 max-rows 중 작은 값만큼 반환 (count는 잘리기 전 전체 행 수)
+            limits = [limit for limit in (query._limit, self.max_rows) if limit is not None]
+            if limits:
+                matched = matched[:min(limits)]
+        return FakeResponse(project(matched, query._columns), count)
+
+    def _insert(self, table, rows, payload, upsert):
+        items = payload if isinstance(payload, list) else [payload]
+        key = AUTO_KEYS.get(table)
+        saved = []
+        for item in items:
+            row = dict(item)
+            if key and key not in row:
+                row[key] = self._next_ids[table]
+                self._next_ids[table] += 1
+            row.setdefault('created_at', datetime.now().isoformat())
+            conflict = UPSERT_KEYS.get(table)
+            if upsert and conflict:
+                rows[:] = [other for other in rows if other.get(conflict) != row.get(conflict)]
+            rows.append(row)
+            saved.append(dict(row))
+        return saved
+
+
+def project(rows, columns):
+    """select 컬럼 목록만 남긴 행 사본을 반환합니다. (임베드 컬럼은 무시)"""
+    names = [name.strip() for name in columns.split(',') if '(' not in name]
+    if '*' in names or not names:
+        return [dict(row) for row in rows]
+    return [{name: row.get(name) for name in names} for row in rows]
+
+
+def _split_top_level(expression):
+    # 괄호와 따옴표 밖의 쉼표로 나눔
+    parts, depth, quoted, current = [], 0, False, ''
+    for char in expression:
+        if char == '"':
+            quoted = not quoted
+        elif not quoted and char == '(':
+            depth += 1
+        elif not quoted and char == ')':
+            depth -= 1
+        if char == ',' and depth == 0 and not quoted:
+            parts.append(current)
+            current = ''
+        else:
+            current += char
+    parts.append(current)
+    return parts
+
+
+def _parse_condition(condition):
+    group = re.fullmatch(r'(and|or)\((.*)\)', condition)
+    if group:
+        combine = all if group.group(1) == 'and' else any
+        matches = [_parse_condition(part) for part in _split_top_level(group.group(2))]
+        return lambda row: combine(match(row) for match in matches)
+    column, op, value = condition.split('.', 2)
+    value = value.strip('"')
+
+    def match(row):
+        actual = row.get(column)
+        expected = type(actual)(value) if isinstance(actual, (int, float)) else value
+        return OPERATORS[op](actual, expected)
+    return match
+
+
+def parse_or_filter(expression):
+    """or_() 필터 문자열 (예: 'created_at.lt."...",and(created_at.eq."...",id.lt.3)')을 판별 함수로 바꿉니다."""
+    matches = [_parse_condition(part) for part in _split_top_level(expression)]
+    return lambda row: any(match(row) for match in matches)
+
+
+# 합성 게시판 구성 (실제 공모전 게시판과 비슷한 구분 비율과 답변 비율)
+CATEGORY_WEIGHTS = {'질문': 40, '정보공유': 25, '아이디어': 25, '기타': 10}
+QUESTION_REPLY_RATIO = 0.6  # 답변이 달린 질문 비율
+OTHER_REPLY_RATIO = 0.1  # 답변이 달린 기타 게시물 비율
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+ROLES = ["교사", "선생님", "쌤", "예비교사", "교감", "정보부장"]
+SUBJECTS = ["초등 3학년", "중학교 과학", "고등 수학", "특수학급", "영어 수업", "방과후 코딩반", "학급 운영", "진로 수업"]
+TOOLS = ["챗봇", "퀴즈 앱", "출결 관리 앱", "독서 기록장", "피드백 도우미", "AI 그림 일기", "받아쓰기 채점기", "모둠 편성기"]
+SENTENCES = {
+    '질문': [
+        "{subject}에서 쓸 {tool}을(를) 만들고 있는데 개인정보가 포함되어도 제출할 수 있나요?",
+        "{tool} 시연 영상은 몇 분 이내로 만들어야 하나요?",
+        "공동 개발자로 {subject} 담당 선생님을 추가해도 되는지 궁금합니다.",
+        "외부 API 키가 필요한 {tool}은(는) 심사 때 어떻게 실행하시나요?",
+        "이미 학교에서 사용 중인 {tool}도 출품 가능한가요?",
+    ],
+    '정보공유': [
+        "{subject} 수업에 {tool}을(를) 적용해 본 후기를 공유합니다.",
+        "Streamlit 배포할 때 secrets 설정을 빠뜨리기 쉬우니 꼭 확인하세요.",
+        "{tool} 만들 때 참고한 무료 강의 목록을 정리했습니다.",
+        "학생 반응이 좋았던 {tool} 화면 구성을 올려 봅니다.",
+    ],
+    '아이디어': [
+        "{subject} 학생들이 스스로 목표를 기록하는 {tool}은(는) 어떨까요?",
+        "{tool}에 음성 입력을 붙이면 저학년도 쉽게 쓸 수 있을 것 같아요.",
+        "{subject}용 {tool}을(를) 같이 만드실 분 찾습니다.",
+    ],
+    '기타': [
+        "마감까지 다들 힘내세요!",
+        "{subject} 선생님들 모임 방 만들었습니다.",
+        "작년 수상작 목록은 어디서 볼 수 있을까요?",
+    ],
+}
+REPLIES = [
+    "네, 가능합니다. 자세한 내용은 공모 요강을 참고해주세요.",
+    "개인정보는 반드시 가명 처리 후 제출해주세요.",
+    "시연 영상은 5분 이내를 권장합니다.",
+    "좋은 아이디어네요. 응원합니다!",
+    "문의하신 내용은 공지사항에 추가로 안내드리겠습니다.",
+]
+DETAILS = [
+    "학생 수는 25명 정도이고 태블릿으로 사용합니다.",
+    "교내 메신저와 연동하는 것도 고려 중입니다.",
+    "혹시 비슷한 경험 있으신 분 조언 부탁드립니다.",
+    "시간이 부족해서 핵심 기능만 먼저 만들 예정입니다.",
+    "학부모 동의서 양식도 함께 준비하고 있어요.",
+]
+
+
+def _post_text(rng, category):
+    subject, tool = rng.choice(SUBJECTS), rng.choice(TOOLS)
+    sentences = [rng.choice(SENTENCES[category]).format(subject=subject, tool=tool)]
+    sentences += rng.sample(DETAILS, rng.randint(0, 3))
+    return " ".join(sentences)
+
+
+def make_board(post_count, seed=0, start=datetime(2025, 7, 1), span=timedelta(days=60)):
+    """게시물 post_count개와 답글로 이루어진 합성 게시판 테이블을 만듭니다.
+
+    작성 시각은 start부터 span 동안 고르게 흩어지고, 답글은 게시물 작성 몇 분~며칠 뒤에 달립니다.
+    """
+    rng = random.Random(seed)
+    categories = list(CATEGORY_WEIGHTS)
+    weights = list(CATEGORY_WEIGHTS.values())
+    step = span / max(post_count, 1)
+    posts, replies = [], []
+    for index in range(post_count):
+        category = rng.choices(categories, weights)[0]
+        created = start + step * index + timedelta(seconds=rng.randint(0, 59))
+        post_id = index + 1
+        posts.append({
+            'id': post_id,
+            'name': f"{rng.choice(SURNAMES)}{rng.choice(ROLES)}{rng.randint(1, 99)}",
+            'category': category,
+            'text': _post_text(rng, category),
+            'created_at': created.isoformat(),
+        })
+        ratio = QUESTION_REPLY_RATIO if category == '질문' else OTHER_REPLY_RATIO
+        if rng.random() < ratio:
+            replied = created
+            for reply_index in range(1 if rng.random() < 0.85 else 2):
+                replied += timedelta(minutes=rng.randint(3, 3 * 24 * 60))
+                replies.append({
+                    'reply_id': len(replies) + 1,
+                    'id': post_id,
+                    'reply': rng.choice(REPLIES),
+                    'created_at': replied.isoformat(),
+                })
+    return {'post': posts, 'reply': replies, 'notice': [], 'blocked_user': []}
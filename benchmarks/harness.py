@@ -0,0 +1,194 @@
+"""AppTest로 app.py를 실행하는 측정용 도우미입니다."""
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import streamlit as st
+import supabase
+from streamlit import config
+from streamlit.runtime import Runtime
+from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+from streamlit.runtime.media_file_manager import MediaFileManager
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.runtime.scriptrunner.script_run_context import SCRIPT_RUN_CONTEXT_ATTR_NAME
+from streamlit.runtime.scriptrunner.script_runner import ScriptRunnerEvent
+from streamlit.runtime.secrets import Secrets
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1 import local_script_runner
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+APP_PATH = REPO_ROOT / "app.py"
+ADMIN_PASSWORD = "benchmark"
+SECRETS = {
+    "SUPABASE_URL": "https://benchmark.invalid",
+    "SUPABASE_ANON_KEY": "benchmark",
+    "ADMIN_PASSWORD": ADMIN_PASSWORD,
+}
+COMMUNITY_MENU = "💬 커뮤니티"
+
+# streamlit run과 같이 app.py가 있는 폴더에서 models 모듈을 찾도록 추가
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+def _reset_triggers_on_rerun():
+    # AppTest는 st.rerun()으로 다시 실행할 때 버튼 클릭 상태를 지우지 않아 같은 동작이 두 번 실행됨
+    # (실제 런타임처럼 rerun 시 트리거 값을 초기화)
+    original = local_script_runner.LocalScriptRunner._on_script_finished
+
+    def on_script_finished(self, ctx, event, premature_stop):
+        if event == ScriptRunnerEvent.SCRIPT_STOPPED_FOR_RERUN:
+            self._session_state._state._reset_triggers()
+        return original(self, ctx, event, premature_stop)
+
+    local_script_runner.LocalScriptRunner._on_script_finished = on_script_finished
+
+
+_reset_triggers_on_rerun()
+
+
+def install_client(client):
+    """app.py가 Supabase 대신 client를 사용하도록 하고, 이전 측정의 공유 캐시를 비웁니다."""
+    supabase.create_client = lambda url, key: client
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+
+def new_session(timeout=600):
+    """저장소가 설정된 새 브라우저 세션 하나를 만듭니다. (아직 실행하지 않음)"""
+    at = AppTest.from_file(str(APP_PATH), default_timeout=timeout)
+    # 동시 실행 모드에서는 전역 secrets를 사용 (세션별로 주면 실행마다 전역 값을 바꿨다가 되돌림)
+    if not _parallel_sessions:
+        at.secrets.update(SECRETS)
+    return at
+
+
+# 동시 실행 모드 여부와 세션 이름 (AppTest 세션 상태 객체 id -> 이름)
+_parallel_sessions = False
+_session_tags = {}
+_thread_tags = threading.local()
+
+
+def enable_parallel_sessions():
+    """여러 AppTest 세션을 스레드에서 동시에 실행할 수 있도록 프로세스 전역 상태를 고정합니다.
+
+    AppTest는 실행할 때마다 st.secrets, Runtime 싱글턴, global.appTest 설정을 바꿨다가 되돌리므로
+    동시에 실행하면 다른 세션이 실행 도중 값을 잃습니다. 세 값을 한 번만 설정해 두고
+    (Runtime은 스크립트 실행 스레드에서만 있는 것으로 보이게 함),
+    공유 스레드 풀에서 실행된 저장소 요청은 요청을 제출한 세션 이름으로 기록되도록 합니다.
+    또한 실행마다 app.py를 새로 컴파일하지 않고 실제 서버처럼 컴파일 결과를 모든 세션이 공유합니다.
+    (Python 3.11의 compile()은 여러 스레드에서 동시에 호출하면 SystemError로 실패할 수 있음)
+    """
+    global _parallel_sessions
+    if _parallel_sessions:
+        return
+    _parallel_sessions = True
+
+    secrets = Secrets([])
+    secrets._secrets = dict(SECRETS)
+    st.secrets = secrets
+    config.set_option("global.appTest", True)
+
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    Runtime.instance = classmethod(lambda cls: cls._instance or runtime)
+    Runtime.exists = classmethod(lambda cls: hasattr(threading.current_thread(), SCRIPT_RUN_CONTEXT_ATTR_NAME))
+
+    submit = ThreadPoolExecutor.submit
+
+    def submit_with_tag(self, fn, /, *args, **kwargs):
+        tag = current_session_tag()
+
+        def run():
+            _thread_tags.value = tag
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _thread_tags.value = None
+        return submit(self, run)
+
+    ThreadPoolExecutor.submit = submit_with_tag
+    script_cache = ScriptCache()
+    local_script_runner.ScriptCache = lambda: script_cache
+    local_script_runner.require_widgets_deltas = _wait_for_script_stop
+
+
+def _wait_for_script_stop(runner, timeout=3):
+    # AppTest는 1ms 간격으로 깨어나며 실행 종료를 확인하므로, 세션이 많으면 대기 중인 스레드들이
+    # GIL을 두고 실행 중인 스크립트와 경쟁함 (종료 이벤트를 받을 때까지 잠들고, 시간 초과 처리는 같게)
+    stopped = threading.Event()
+
+    def on_event(sender, event, **kwargs):
+        if event == ScriptRunnerEvent.SHUTDOWN:
+            stopped.set()
+
+    runner.on_event.connect(on_event, weak=False)
+    try:
+        if runner.script_stopped() or stopped.wait(timeout):
+            return
+    finally:
+        runner.on_event.disconnect(on_event)
+    runner.request_stop()
+    runner.join()
+    raise RuntimeError(f"AppTest script run timed out after {timeout}(s)")
+
+
+def tag_session(at, tag):
+    """세션 at에서 보낸 저장소 요청을 tag 이름으로 기록하도록 등록합니다."""
+    _session_tags[id(at.session_state._state)] = tag
+
+
+def current_session_tag():
+    """현재 스레드가 처리 중인 세션의 이름을 반환합니다. (세션 밖의 작업이면 None)"""
+    tag = getattr(_thread_tags, "value", None)
+    if tag is None:
+        ctx = get_script_run_ctx(suppress_warning=True)
+        if ctx is not None:
+            tag = _session_tags.get(id(ctx.session_state._state))
+    return tag
+
+
+def check(at):
+    """실행 중 발생한 예외가 있으면 RuntimeError로 알립니다."""
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return at
+
+
+def open_community(at):
+    at.sidebar.radio[0].set_value(COMMUNITY_MENU)
+    return check(at.run())
+
+
+def clear_stale_widgets(at, widgets):
+    """요소 트리에 남아 있는 사라진 위젯의 값을 비워, 다음 실행 때 세션 상태에서 찾지 않도록 합니다.
+
+    AppTest는 fragment 안에서 st.rerun()으로 전체를 다시 실행하면, 다시 그려지지 않은
+    fragment 위젯(예: 로그인 후의 로그인 폼)을 요소 트리에 남겨 둡니다.
+    """
+    for widget in widgets:
+        if widget.id not in at.session_state:
+            widget.set_value(None)
+
+
+def find_widget(widgets, label=None, key=None):
+    """라벨 또는 키로 위젯을 찾습니다. 없으면 None을 반환합니다."""
+    for widget in widgets:
+        if (key is not None and widget.key == key) or (label is not None and widget.label == label):
+            return widget
+    return None
+
+
+def find_button(at, label=None, key=None):
+    """라벨 또는 키로 버튼을 찾습니다. 없으면 None을 반환합니다."""
+    return find_widget(at.button, label, key)
+
+
+def count_cards(at):
+    """화면에 표시된 게시물 카드 수를 반환합니다."""
+    return sum(markdown.value.count('class="post-card"') for markdown in at.markdown)
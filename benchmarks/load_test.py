@@ -0,0 +1,325 @@
+"""여러 사용자가 동시에 커뮤니티를 사용할 때의 다시 실행(rerun) 지연 시간을 측정합니다.
+
+    python -m benchmarks.load_test --users 200 --posts 2000 --latency 0.05
+
+사용자마다 AppTest 세션 하나를 스레드에서 실행하며, 저장소는 메모리 대역(fake_supabase)을 사용합니다.
+사용자는 마감일 상황을 가정한 비율로 아래 여정 중 하나를 따릅니다.
+
+- visitor: 커뮤니티 열기 -> 피드 더 보기 -> 검색
+- poster: 커뮤니티 열기 -> 글 작성 -> 저장 확인까지 대기
+- admin: 커뮤니티 열기 -> 관리자 로그인 -> 답변 대기 질문에 답변 -> 저장 확인까지 대기
+
+여정별/단계별 지연 시간 분포(p50/p90/p99, 히스토그램)와 여정별 저장소 호출 수를 출력하고 JSON으로 저장합니다.
+"""
+import argparse
+import json
+import platform
+import random
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+from pathlib import Path
+
+import streamlit
+
+from benchmarks.fake_supabase import FakeSupabaseClient, make_board
+from benchmarks.harness import (
+    ADMIN_PASSWORD,
+    check,
+    clear_stale_widgets,
+    current_session_tag,
+    enable_parallel_sessions,
+    find_button,
+    find_widget,
+    install_client,
+    new_session,
+    open_community,
+    tag_session,
+)
+
+RESULTS_DIR = "benchmarks/results"
+DEFAULT_MIX = "visitor=70,poster=25,admin=5"
+# 히스토그램 구간 상한 (ms)
+HISTOGRAM_BOUNDS_MS = [25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+# 저장 확인 대기 (app.py의 WRITE_STATUS_POLL_INTERVAL과 같은 주기로 다시 실행)
+CONFIRM_POLL_INTERVAL = 1.0
+CONFIRM_TIMEOUT = 60
+FEED_MORE_CLICKS = 2
+SEARCH_TERMS = ["개인정보", "시연 영상", "챗봇", "Streamlit 배포"]
+ADMIN_REPLIES_PER_USER = 2
+
+
+class Recorder:
+    """여정/단계별 다시 실행 지연 시간과 실패를 모읍니다. (여러 스레드에서 호출)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)  # (여정, 단계) -> 지연 시간 목록 (초)
+        self.failures = defaultdict(list)  # 여정 -> 오류 메시지 목록
+
+    def add(self, journey, step, seconds):
+        with self._lock:
+            self.latencies[(journey, step)].append(seconds)
+
+    def fail(self, journey, error):
+        with self._lock:
+            self.failures[journey].append(f"{type(error).__name__}: {error}")
+
+
+class User:
+    """AppTest 세션 하나로 여정을 진행하는 가상 사용자입니다."""
+
+    def __init__(self, index, journey, recorder, rng, think, timeout):
+        self.name = f"{journey}-{index}"
+        self.journey = journey
+        self.recorder = recorder
+        self.rng = rng
+        self.think = think
+        self.at = new_session(timeout)
+        tag_session(self.at, self.name)
+
+    def step(self, name, action):
+        """action()으로 한 번 다시 실행하고 지연 시간을 기록합니다."""
+        started = time.perf_counter()
+        check(action())
+        self.recorder.add(self.journey, name, time.perf_counter() - started)
+        if self.think:
+            time.sleep(self.rng.uniform(0, self.think))
+
+    def open(self):
+        self.step("app_start", self.at.run)
+        self.step("open_community", lambda: open_community(self.at))
+
+    def wait_confirmed(self):
+        # 저장 대기 중인 글이 없어질 때까지 앱의 상태 확인 주기로 다시 실행
+        deadline = time.monotonic() + CONFIRM_TIMEOUT
+        while self.at.session_state["pending_writes"]:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"{CONFIRM_TIMEOUT}초 안에 저장이 확인되지 않았습니다.")
+            time.sleep(CONFIRM_POLL_INTERVAL)
+            self.step("confirm_poll", self.at.run)
+
+    def visitor(self):
+        self.open()
+        for _ in range(FEED_MORE_CLICKS):
+            button = find_button(self.at, label="더 보기")
+            if button is None:
+                break
+            self.step("feed_more", button.click().run)
+        self.step("search", self.at.text_input(key="feed_search").input(self.rng.choice(SEARCH_TERMS)).run)
+        self.step("search_clear", self.at.text_input(key="feed_search").input("").run)
+
+    def poster(self):
+        self.open()
+        find_widget(self.at.text_input, label="이름 또는 닉네임").input(self.name)
+        find_widget(self.at.selectbox, label="구분").select(self.rng.choice(["질문", "정보공유", "아이디어"]))
+        find_widget(self.at.text_area, label="내용을 입력하세요").input(
+            f"마감 전에 확인 부탁드립니다. 시연 영상은 몇 분까지 가능한가요? ({self.name})"
+        )
+        self.step("submit_post", find_button(self.at, label="✏️ 작성하기").click().run)
+        self.wait_confirmed()
+
+    def admin(self):
+        self.open()
+        self.step("admin_button", find_button(self.at, key="admin_login_btn").click().run)
+        find_widget(self.at.text_input, label="비밀번호").input(ADMIN_PASSWORD)
+        self.step("admin_login", find_button(self.at, label="로그인").click().run)
+        clear_stale_widgets(self.at, self.at.text_input)
+        for _ in range(ADMIN_REPLIES_PER_USER):
+            # 답변 대기 탭에서 오래 기다린 질문 중 하나에 답변 (관리자끼리 겹치지 않도록 무작위 선택)
+            open_buttons = [
+                button for button in self.at.button
+                if button.key and button.key.startswith("inbox_reply_open_")
+            ]
+            if not open_buttons:
+                break
+            post_id = self.rng.choice(open_buttons[:10]).key.removeprefix("inbox_reply_open_")
+            self.step("reply_open", find_button(self.at, key=f"inbox_reply_open_{post_id}").click().run)
+            self.at.text_area(key=f"inbox_reply_{post_id}").input("확인했습니다. 공모 요강 5쪽을 참고해주세요.")
+            self.step("reply_submit", find_button(self.at, key=f"inbox_reply_btn_{post_id}").click().run)
+            self.wait_confirmed()
+
+    def run(self):
+        try:
+            getattr(self, self.journey)()
+        except Exception as e:
+            self.recorder.fail(self.journey, e)
+
+
+def parse_mix(text):
+    """'visitor=70,poster=25,admin=5' 형식의 여정 비율을 dict로 바꿉니다."""
+    mix = {}
+    for part in text.split(","):
+        journey, weight = part.split("=")
+        if not hasattr(User, journey.strip()):
+            raise argparse.ArgumentTypeError(f"알 수 없는 여정입니다: {journey}")
+        mix[journey.strip()] = float(weight)
+    return mix
+
+
+def percentile(sorted_values, pct):
+    """정렬된 값 목록의 nearest-rank 백분위수를 반환합니다."""
+    if not sorted_values:
+        return None
+    rank = max(int(-(-pct * len(sorted_values) // 100)), 1)
+    return sorted_values[rank - 1]
+
+
+def summarize(latencies):
+    """지연 시간 목록(초)의 개수, 백분위수(ms), 히스토그램을 반환합니다."""
+    values = sorted(latencies)
+    histogram = Counter()
+    for value in values:
+        ms = value * 1000
+        bucket = next((f"<={bound}ms" for bound in HISTOGRAM_BOUNDS_MS if ms <= bound), f">{HISTOGRAM_BOUNDS_MS[-1]}ms")
+        histogram[bucket] += 1
+    labels = [f"<={bound}ms" for bound in HISTOGRAM_BOUNDS_MS] + [f">{HISTOGRAM_BOUNDS_MS[-1]}ms"]
+    return {
+        "count": len(values),
+        "p50_ms": round(percentile(values, 50) * 1000, 1) if values else None,
+        "p90_ms": round(percentile(values, 90) * 1000, 1) if values else None,
+        "p99_ms": round(percentile(values, 99) * 1000, 1) if values else None,
+        "max_ms": round(values[-1] * 1000, 1) if values else None,
+        "histogram": {label: histogram[label] for label in labels},
+    }
+
+
+def run_load_test(args):
+    enable_parallel_sessions()
+    tables = make_board(args.posts, seed=args.seed)
+    client = FakeSupabaseClient(
+        tables, latency=args.latency, jitter=args.jitter, seed=args.seed,
+        tagger=current_session_tag, max_rows=args.max_rows or None,
+    )
+    install_client(client)
+
+    # 앱 초기화(저장소 연결, 공유 스레드 풀 생성 등)는 측정에서 제외
+    check(new_session(args.timeout).run())
+    client.reset_stats()
+
+    rng = random.Random(args.seed)
+    journeys = rng.choices(list(args.mix), weights=list(args.mix.values()), k=args.users)
+    recorder = Recorder()
+    users = [
+        User(index, journey, recorder, random.Random(args.seed + index), args.think, args.timeout)
+        for index, journey in enumerate(journeys)
+    ]
+
+    # ramp초 동안 고르게 나누어 접속
+    started = time.perf_counter()
+    threads = []
+    for index, user in enumerate(users):
+        delay = started + args.ramp * index / max(len(users), 1) - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        thread = threading.Thread(target=user.run, name=user.name, daemon=True)
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    # 여정별 결과 집계
+    journey_users = Counter(journeys)
+    by_journey = {}
+    for journey in args.mix:
+        steps = {
+            step: summarize(values)
+            for (name, step), values in recorder.latencies.items()
+            if name == journey
+        }
+        calls = Counter()
+        for user in users:
+            if user.journey == journey:
+                calls.update(client.calls_by_tag.get(user.name, Counter()))
+        by_journey[journey] = {
+            "users": journey_users[journey],
+            "failed_users": len(recorder.failures[journey]),
+            "failures": recorder.failures[journey][:5],
+            "reruns": summarize([value for (name, _), values in recorder.latencies.items() if name == journey for value in values]),
+            "steps": steps,
+            "backend_calls": sum(calls.values()),
+            "backend_calls_per_user": round(sum(calls.values()) / journey_users[journey], 1) if journey_users[journey] else 0,
+            "backend_calls_by_table": {f"{table}.{op}": count for (table, op), count in sorted(calls.items())},
+        }
+    background = client.calls_by_tag.get(None, Counter())
+
+    return {
+        "benchmark": "load_test",
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "users": args.users,
+        "posts": args.posts,
+        "latency_s": args.latency,
+        "jitter_s": args.jitter,
+        "max_rows": args.max_rows or None,
+        "ramp_s": args.ramp,
+        "think_s": args.think,
+        "elapsed_s": round(elapsed, 2),
+        "all_reruns": summarize([value for values in recorder.latencies.values() for value in values]),
+        "journeys": by_journey,
+        # 쓰기 대기열 등 세션 밖에서 보낸 요청
+        "background_calls": sum(background.values()),
+        "background_calls_by_table": {f"{table}.{op}": count for (table, op), count in sorted(background.items())},
+    }
+
+
+def format_ms(value):
+    """밀리초 값을 'NNms'로 반환합니다. (측정값이 없으면 '-')"""
+    return "-" if value is None else f"{value}ms"
+
+
+def print_summary(report):
+    overall = report["all_reruns"]
+    print(
+        f"사용자 {report['users']}명, 게시물 {report['posts']:,}개, {report['elapsed_s']}초 소요 - "
+        f"다시 실행 {overall['count']}회 p50 {format_ms(overall['p50_ms'])} / p99 {format_ms(overall['p99_ms'])}"
+    )
+    for journey, result in report["journeys"].items():
+        reruns = result["reruns"]
+        print(
+            f"\n[{journey}] 사용자 {result['users']}명 (실패 {result['failed_users']}), "
+            f"저장소 호출 {result['backend_calls']}회 (1인당 {result['backend_calls_per_user']})"
+        )
+        print(f"  전체          {reruns['count']:>5}회  p50 {format_ms(reruns['p50_ms'])}  p99 {format_ms(reruns['p99_ms'])}")
+        for step, summary in result["steps"].items():
+            print(
+                f"  {step:<14}{summary['count']:>5}회  p50 {format_ms(summary['p50_ms'])}  "
+                f"p90 {format_ms(summary['p90_ms'])}  p99 {format_ms(summary['p99_ms'])}  최대 {format_ms(summary['max_ms'])}"
+            )
+        for failure in result["failures"]:
+            print(f"  실패: {failure}")
+    print(f"\n세션 밖 저장소 호출 (쓰기 대기열 등): {report['background_calls']}회")
+    print("\n다시 실행 지연 시간 분포 (전체)")
+    peak = max(overall["histogram"].values(), default=0) or 1
+    for label, count in overall["histogram"].items():
+        print(f"  {label:>10} {count:>6} {'#' * round(40 * count / peak)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="커뮤니티 다중 세션 부하 테스트")
+    parser.add_argument("--users", type=int, default=200, help="동시 사용자 수")
+    parser.add_argument("--posts", type=int, default=2000, help="합성 게시판의 게시물 수")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX), help=f"여정 비율 (기본: {DEFAULT_MIX})")
+    parser.add_argument("--latency", type=float, default=0.05, help="저장소 요청별 지연 시간 (초)")
+    parser.add_argument("--jitter", type=float, default=0.02, help="지연 시간에 더할 무작위 값의 최대치 (초)")
+    parser.add_argument("--max-rows", type=int, default=1000, help="조회 응답 하나의 최대 행 수 (Supabase max-rows, 0이면 제한 없음)")
+    parser.add_argument("--ramp", type=float, default=10, help="모든 사용자가 접속을 시작할 때까지의 시간 (초)")
+    parser.add_argument("--think", type=float, default=0.5, help="단계 사이 최대 대기 시간 (초)")
+    parser.add_argument("--timeout", type=float, default=600, help="AppTest 실행 한 번의 제한 시간 (초)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/load-<시각>.json)")
+    args = parser.parse_args()
+
+    report = run_load_test(args)
+    print_summary(report)
+    output = args.output or f"{RESULTS_DIR}/load-{datetime.now():%Y%m%d-%H%M%S}.json"
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+    Path(output).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"\n결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""커뮤니티 게시물/답글 레코드입니다.
+
+app.py는 위젯을 조작할 때마다 다시 실행되어 그 안에서 정의한 클래스가 매번 새로 만들어집니다.
+st.cache_data가 피클링하는 레코드 클래스는 클래스 객체가 바뀌지 않도록 별도 모듈에 둡니다.
+"""
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+
+# 시각을 표시할 시간대 (서버 시간대와 무관하게 set_display_timezone으로 지정한 시간대 사용)
+_display_timezone = timezone.utc
+
+
+def set_display_timezone(tz):
+    """시각을 표시할 시간대(tzinfo)를 지정합니다."""
+    global _display_timezone
+    if tz != _display_timezone:
+        _display_timezone = tz
+        _format_minute.cache_clear()
+
+
+# 분 단위 시각 문자열 (같은 분에 속한 시각은 한 번만 포맷)
+@lru_cache(maxsize=4096)
+def _format_minute(minute):
+    return datetime.fromtimestamp(minute * 60, _display_timezone).strftime('%Y-%m-%d %H:%M')
+
+
+def format_time(ts):
+    """epoch 시각을 표시 시간대의 'YYYY-MM-DD HH:MM' 형식으로 반환합니다."""
+    return _format_minute(int(ts // 60))
+
+
+def format_date(ts):
+    """epoch 시각을 표시 시간대의 'YYYY-MM-DD' 형식으로 반환합니다."""
+    return _format_minute(int(ts // 60))[:10]
+
+
+# 경과 분 단위 상대 시각 문자열
+@lru_cache(maxsize=4096)
+def _format_minutes_ago(minutes):
+    if minutes >= 24 * 60:
+        return f"{minutes // (24 * 60)}일전"
+    if minutes >= 60:
+        return f"{minutes // 60}시간전"
+    if minutes >= 1:
+        return f"{minutes}분전"
+    return "방금전"
+
+
+def format_time_ago(ts, now=None):
+    """epoch 시각을 현재 시각 기준 '?분전', '?시간전', '?일전' 형식으로 반환합니다."""
+    now = time.time() if now is None else now
+    return _format_minutes_ago(max(int(now - ts) // 60, 0))
+
+
+@dataclass(frozen=True, slots=True)
+class Reply:
+    """관리자 답글입니다. 시각은 epoch로 한 번만 변환해 저장합니다."""
+
+    text: str
+    created_ts: float
+    reply_id: int = None  # 저장소 답글 ID (스냅샷 중복 제거용, 로컬 답글이면 None)
+
+    @property
+    def time(self):
+        return format_time(self.created_ts)
+
+
+@dataclass(frozen=True, slots=True)
+class Post:
+    """게시물입니다. 표시용 시각과 답변 상태는 필요할 때 계산합니다.
+    
+    여러 세션과 피드 버전이 같은 레코드를 공유하므로 수정할 수 없습니다.
+    (답글 추가 등은 dataclasses.replace로 새 레코드를 만듭니다.)
+    """
+
+    id: int  # 저장소 게시물 ID (저장 전이면 None)
+    name: str
+    type: str  # 구분 (DB의 category)
+    text: str
+    created_at: str  # 원본 시각 문자열 (페이지 커서용)
+    created_ts: float
+    replies: tuple = ()
+    pending: bool = False  # 쓰기 대기열에서 저장을 기다리는 중
+
+    @property
+    def status(self):
+        if self.pending:
+            return 'pending'
+        if self.replies:
+            return 'answered'
+        return 'waiting' if self.type == '질문' else 'none'
+
+    @property
+    def time(self):
+        return format_time(self.created_ts)
+
+    @property
+    def time_ago(self):
+        return format_time_ago(self.created_ts)
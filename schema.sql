@@ -0,0 +1,41 @@
+-- Supabase(Postgres) 테이블 정의
+-- Supabase 대시보드의 SQL Editor에서 실행합니다. 이미 있는 테이블과 인덱스는 건너뜁니다.
+-- (SQLite 저장소는 app.py의 SQLiteStorage.SCHEMA로 자동 생성됨)
+
+-- 게시물
+create table if not exists post (
+    id bigint generated by default as identity primary key,
+    name text not null,
+    category text not null,
+    text text not null,
+    created_at timestamptz not null default now()
+);
+
+-- 답글 (id: 게시물 ID, 게시물이 삭제되면 함께 삭제)
+create table if not exists reply (
+    reply_id bigint generated by default as identity primary key,
+    id bigint not null references post (id) on delete cascade,
+    reply text not null,
+    created_at timestamptz not null default now()
+);
+
+create index if not exists idx_post_created on post (created_at desc, id desc);
+create index if not exists idx_reply_post on reply (id, created_at);
+create index if not exists idx_reply_created on reply (created_at);
+
+-- 공지사항
+create table if not exists notice (
+    id bigint generated by default as identity primary key,
+    type text not null,
+    content text not null,
+    created_at timestamptz not null default now()
+);
+
+-- 차단 사용자 (이름당 한 행, 다시 차단하면 upsert로 덮어씀)
+create table if not exists blocked_user (
+    name text primary key,
+    created_at timestamptz not null default now()
+);
+
+-- RLS를 사용하는 프로젝트라면 post/reply와 같이 anon 키에 notice, blocked_user의
+-- select/insert/delete(blocked_user는 update 포함) 권한을 주는 정책을 추가해야 합니다.